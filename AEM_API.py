@@ -5,6 +5,8 @@
 
 ## IMPORT LIBRARIES AND DEPENDENCIES
 import errno
+import asyncio
+import hashlib
 import time
 import subprocess as sp
 import pandas as pd
@@ -14,11 +16,17 @@ import re
 from collections import OrderedDict
 import datetime
 import json
+import queue
 import uuid
 import os
 import sys
 import shutil
-from AEM_PARSER import aem_run, aem_convert_to_csv, aem_convert_to_json
+import signal
+import sqlite3
+import tempfile
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from AEM_PARSER import aem_run, aem_convert, merge_report_files, splitReportText, reportBlockKey, REPORT_SPECS, archive_reports, locateReports
 
 ## DELIMITERS AND DEFAULT PRECISION VALUES
 delim1 = "|"
@@ -29,7 +37,7 @@ vals2str = lambda ls: [str(x) for x in ls]
 
 ## API, AEM, & OUTPUT DIRECTORY PATHS
 API_HOME_PATH = os.path.dirname(os.path.realpath(__file__))
-DLM_EXECUTABLE = "DLM_Executable.exe"
+DLM_EXECUTABLE = os.environ.get("AEM_DLM_EXECUTABLE", "DLM_Executable.exe")  # e.g. the AEM_STANDIN launcher
 
 ## SOLVENT AND SALT DIRECTORY PATHS
 SOLVENT_DB = os.path.join(API_HOME_PATH, "data", "solventDB.csv")
@@ -38,6 +46,209 @@ AEM_SOLVENTS = os.path.join(API_HOME_PATH, "data", "AEM_solvents.csv")
 AEM_SALTS = os.path.join(API_HOME_PATH, "data", "AEM_salts.csv")
 AEM_ACCC_SOLVENTS = os.path.join(API_HOME_PATH, "data", "AEM_ACCC_solvents.csv")
 AEM_ACCC_SALTS = os.path.join(API_HOME_PATH, "data", "AEM_ACCC_salts.csv")
+
+## DLM LICENCE STATUS CACHE
+DLM_CACHE_FILE = os.path.join(API_HOME_PATH, ".dlm_status.json")
+DLM_CACHE_TTL_SEC = 3600
+_dlm_status = {}    # process-wide cache: AEM home -> (status, checked_at)
+_dlm_pending = {}   # AEM home -> Future of an in-flight check
+_dlm_lock = threading.Lock()
+
+def spawn_dlm_check(AEMHomePath=None):
+    """Run `DLM_Executable.exe check` and return its output ('1': AEM only, '6': AEM with ACCC)."""
+    print(f"### AEM-API v1.3.0:: Checking ACCC Access from DLM ...")
+    fp = os.path.join(API_HOME_PATH, DLM_EXECUTABLE)
+    # Run the executable with the 'check' argument
+    p = sp.Popen([fp, 'check'], stdout=sp.PIPE, stderr=sp.STDOUT, cwd=AEMHomePath)
+    # Capture the output
+    stdout, _ = p.communicate()  # Capture output
+    stdout = stdout.decode('utf-8').strip()  # Decode and strip any extra whitespace/newlines
+    # Log the output and return it
+    if stdout == '1':
+        print(f"### AEM-API v1.3.0:: ACCC Access Invalid!")
+    elif stdout == '6':
+        print(f"### AEM-API v1.3.0:: ACCC Access Valid")
+    else:
+        print(f"### AEM-API v1.3.0:: Unknown output: {stdout}")
+    print(f"### AEM-API v1.3.0:: ACCC Access Check Complete!")
+    return stdout
+
+def _dlm_cache_key(AEMHomePath):
+    return os.path.realpath(AEMHomePath) if AEMHomePath else ""
+
+def _read_dlm_cache_file():
+    try:
+        with open(DLM_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _write_dlm_cache_file(key, status, checked_at):
+    entries = _read_dlm_cache_file()
+    entries[key] = {"status": status, "checked_at": checked_at}
+    try:
+        tmp = f"{DLM_CACHE_FILE}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(entries, f, indent=4)
+        os.replace(tmp, DLM_CACHE_FILE)
+    except OSError:
+        pass  # the on-disk cache is best effort (e.g. read-only install)
+
+def _cached_dlm_status(key, ttl):
+    now = time.time()
+    with _dlm_lock:
+        cached = _dlm_status.get(key)
+    if cached is not None and now - cached[1] < ttl:
+        return cached[0]
+    entry = _read_dlm_cache_file().get(key)
+    if entry is not None and now - entry.get("checked_at", 0) < ttl:
+        with _dlm_lock:
+            _dlm_status[key] = (entry["status"], entry["checked_at"])
+        return entry["status"]
+    return None
+
+def _start_dlm_check(AEMHomePath, background):
+    key = _dlm_cache_key(AEMHomePath)
+    with _dlm_lock:
+        future = _dlm_pending.get(key)
+        owner = future is None
+        if owner:
+            future = _dlm_pending[key] = Future()
+    if not owner:
+        return future  # join the check that is already in flight
+    def work():
+        try:
+            status = spawn_dlm_check(AEMHomePath)
+            if status in ('1', '6'):  # never cache an unknown answer
+                checked_at = time.time()
+                with _dlm_lock:
+                    _dlm_status[key] = (status, checked_at)
+                _write_dlm_cache_file(key, status, checked_at)
+            future.set_result(status)
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with _dlm_lock:
+                _dlm_pending.pop(key, None)
+    if background:
+        threading.Thread(target=work, name="DLMPrefetch", daemon=True).start()
+    else:
+        work()
+    return future
+
+def check_dlm_access(AEMHomePath=None, ttl=DLM_CACHE_TTL_SEC, refresh=False):
+    """Return the DLM licence status, reusing a process-wide or on-disk result younger than `ttl` seconds."""
+    if not refresh:
+        status = _cached_dlm_status(_dlm_cache_key(AEMHomePath), ttl)
+        if status is not None:
+            return status
+    return _start_dlm_check(AEMHomePath, background=False).result()
+
+def refresh_dlm_access(AEMHomePath=None):
+    """Force a new licence check and update both caches."""
+    return check_dlm_access(AEMHomePath, refresh=True)
+
+def prefetch_dlm_access(AEMHomePath=None, ttl=DLM_CACHE_TTL_SEC):
+    """Start the licence check in a background thread unless a fresh status is already cached."""
+    if _cached_dlm_status(_dlm_cache_key(AEMHomePath), ttl) is None:
+        _start_dlm_check(AEMHomePath, background=True)
+
+def clear_dlm_cache():
+    """Forget all cached licence statuses, in this process and on disk."""
+    with _dlm_lock:
+        _dlm_status.clear()
+    try:
+        os.remove(DLM_CACHE_FILE)
+    except OSError:
+        pass
+
+## RUNTIME FORMAT
+def format_runtime(runtime):
+    """Format a runtime in seconds as HH:MM:SS.mmm."""
+    hours = int(runtime // 3600)
+    minutes = int((runtime % 3600) // 60)
+    seconds = int(runtime % 60)
+    milliseconds = int((runtime % 1) * 1000)  # Convert fractional seconds to milliseconds
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+
+## MATRIX SPLIT HELPERS
+def positive_partitions(total, parts):
+    """Yield every tuple of `parts` positive integers that sums to `total`."""
+    if parts == 1:
+        if total > 0:
+            yield (total,)
+        return
+    for first in range(1, total - parts + 2):
+        for rest in positive_partitions(total - first, parts - 1):
+            yield (first,) + rest
+
+MIN_TEMPERATURE_SPAN = 20  # AEM requires tmax - tmin > 20 degC
+# Reports fitted over a run's whole temperature range; merging them from temperature shards would be wrong
+TEMPERATURE_FITTED_REPORTS = ("Report6 -- Activation Energies",)
+
+def split_temperature_range(tmin, tmax, stepsize, shards, min_span=MIN_TEMPERATURE_SPAN):
+    """Split tmin..tmax into up to `shards` consecutive (tmin, tmax) sub-ranges on the stepsize grid.
+
+    Every sub-range spans more than min_span, as AEM requires. Short sub-ranges are widened into their
+    neighbours, and the overlapping temperatures are dropped again when the reports are merged.
+    """
+    count = int(round((tmax - tmin) / stepsize)) + 1
+    temperatures = [round(tmin + k * stepsize, 6) for k in range(count)]
+    shards = max(1, min(shards, count))
+    size = -(-count // shards)
+    ranges = []
+    for first in range(0, count, size):
+        lo, hi = first, min(first + size, count) - 1
+        while temperatures[hi] - temperatures[lo] <= min_span and lo > 0:
+            lo -= 1
+        while temperatures[hi] - temperatures[lo] <= min_span and hi < count - 1:
+            hi += 1
+        if (temperatures[lo], temperatures[hi]) not in ranges:
+            ranges.append((temperatures[lo], temperatures[hi]))
+    return ranges
+
+## PROCESS CONTROL
+def process_group_kwargs():
+    """Popen keyword arguments that start the AEM executable as the leader of its own process group."""
+    if os.name == 'nt':
+        return {"creationflags": sp.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+def kill_process_tree(pid):
+    """Kill a process started with process_group_kwargs() together with every process it spawned."""
+    try:
+        if os.name == 'nt':
+            sp.run(["taskkill", "/F", "/T", "/PID", str(pid)], stdout=sp.DEVNULL, stderr=sp.DEVNULL)
+        else:
+            os.killpg(pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass  # already exited
+
+def report_stat(path):
+    """Return (mtime_ns, size, inode) of a report file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+## SANDBOX HELPERS
+SANDBOX_PREFIX = "AEMSandbox_"
+
+def link_or_copy(src, dst):
+    """Hardlink src to dst, falling back to a symlink and finally a plain copy."""
+    try:
+        os.link(src, dst)
+        return "hardlink"
+    except OSError:
+        pass
+    try:
+        os.symlink(src, dst)
+        return "symlink"
+    except OSError:
+        pass
+    shutil.copy2(src, dst)
+    return "copy"
     
 ## ElectrolyteComposition CLASS
 class ElectrolyteComposition:
@@ -302,9 +513,40 @@ class AEM_API:
                  output_dir=None,
                  run_name=None,
                  AEMHomePath=None,
-                 AEMProgramName=None):
+                 AEMProgramName=None,
+                 sandbox=False,
+                 sandbox_dir=None,
+                 result_cache=None,
+                 dlm_cache_ttl=DLM_CACHE_TTL_SEC,
+                 dlm_refresh=False,
+                 timeout=None,
+                 max_retries=0,
+                 retry_backoff=5.0,
+                 parse_workers=None,
+                 results_db=None,
+                 archive_compression=None):
+        # Constructor arguments, kept so that split runs can create equivalent sub-runs
+        self.init_params = {k: v for k, v in locals().items() if k != "self"}
         self.AEMHomePath = AEMHomePath
-        DLMout = self.runDLMExecutable()
+        self.sandbox = sandbox
+        self.sandbox_dir = sandbox_dir
+        self.run_dir = AEMHomePath
+        self.result_cache = result_cache
+        self.cache_key = None
+        self.cache_hit = False
+        self.subruns = None
+        self.parsed_run = None  # aem_run parsed while converting this run's Reports
+        self.progress_monitor = None
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.parse_workers = parse_workers  # processes used to parse the Reports, see aem_run.parse_run
+        self.results_db = results_db  # AEM_ResultsDB the reports are ingested into when the run log is saved
+        self.archive_compression = archive_compression  # 'zip', 'gz' or 'xz' to pack the Reports folder after the run
+        self.attempts = []
+        self.process = None
+        self.cancel_event = threading.Event()
+        DLMout = check_dlm_access(AEMHomePath, ttl=dlm_cache_ttl, refresh=dlm_refresh)
         if DLMout == '1':
             self.read_AEM_data(salt_csv, solvent_csv)
         if DLMout == '6':
@@ -399,24 +641,37 @@ class AEM_API:
                 raise ValueError(f"Salt {salt} does not match any solvent in {list(self.AEM_ACCC_solvents.keys())}.")
         return None
 
-    # Method to run the AEM model
+    # Method to run the DLM licence check, bypassing the licence status cache
     def runDLMExecutable(self):
-        print(f"### AEM-API v1.3.0:: Checking ACCC Access from DLM ...")
-        fp = os.path.join(API_HOME_PATH, DLM_EXECUTABLE)
-        # Run the executable with the 'check' argument
-        p = sp.Popen([fp, 'check'], shell=True, stdout=sp.PIPE, stderr=sp.STDOUT, cwd=self.AEMHomePath)
-        # Capture the output
-        stdout, _ = p.communicate()  # Capture output
-        stdout = stdout.decode('utf-8').strip()  # Decode and strip any extra whitespace/newlines
-        # Log the output and return it
-        if stdout == '1':
-            print(f"### AEM-API v1.3.0:: ACCC Access Invalid!")
-        elif stdout == '6':
-            print(f"### AEM-API v1.3.0:: ACCC Access Valid")
-        else:
-            print(f"### AEM-API v1.3.0:: Unknown output: {stdout}")
-        print(f"### AEM-API v1.3.0:: ACCC Access Check Complete!")
-        return stdout
+        return spawn_dlm_check(self.AEMHomePath)
+
+    # Method to create a private scratch directory for this run, linked to the AEM home
+    def create_sandbox(self):
+        home = os.path.realpath(self.AEMHomePath)
+        root = None if self.sandbox_dir is None else os.path.realpath(self.sandbox_dir)
+        if root is not None:
+            os.makedirs(root, exist_ok=True)
+        self.run_dir = tempfile.mkdtemp(prefix=f"{SANDBOX_PREFIX}{self.run_id}_", dir=root)
+        for dirpath, dirnames, filenames in os.walk(home):
+            # Never descend into the sandbox root or into other runs' sandboxes
+            dirnames[:] = [d for d in dirnames
+                           if not d.startswith(SANDBOX_PREFIX) and os.path.join(dirpath, d) != root]
+            rel = os.path.relpath(dirpath, home)
+            dst_dir = self.run_dir if rel == os.curdir else os.path.join(self.run_dir, rel)
+            os.makedirs(dst_dir, exist_ok=True)
+            for filename in filenames:
+                if rel == os.curdir and filename in self.report_files:
+                    continue  # stale reports from earlier runs in the AEM home
+                link_or_copy(os.path.join(dirpath, filename), os.path.join(dst_dir, filename))
+        print(f"### AEM-API v1.3.0:: Run {self.run_id}: Sandbox created at {self.run_dir}")
+        return self.run_dir
+
+    # Method to remove the run's scratch directory once its reports have been collected
+    def remove_sandbox(self):
+        if self.run_dir != self.AEMHomePath and os.path.isdir(self.run_dir):
+            shutil.rmtree(self.run_dir, ignore_errors=True)
+            print(f"### AEM-API v1.3.0:: Run {self.run_id}: Sandbox {self.run_dir} removed")
+        self.run_dir = self.AEMHomePath
     def accc_generate_solvent_cues(self):
         number_of_solvents = len(self.electrolyte.solvents)
         if self.solventcomp == 1: #Fixed Composition Mode
@@ -690,14 +945,36 @@ class AEM_API:
             self.aem_generate_accc_cues()
 
     # Method to run the AEM model
-    def runAEM(self, quiet=True):
+    def runAEM(self, quiet=True, progress=None):
         print(f"### AEM-API v1.3.0:: Starting Run {self.run_id}...")
-        if not self.cues:
-            raise ValueError("cues not populated, run generate_cues first")
-        # generate input byte string
-        inp = [str(cue) for cue in self.cues]
-        print(f"### AEM-API v1.3.0:: Cues: {inp}...")
-        inpb = bytes('\n'.join(inp) + '\n\n', encoding="ascii")
+        inpb = self.get_cue_bytes()
+        if self.load_cached_result():
+            self.replay_progress(progress)
+            self.save_run_log()
+            self.run_yet = True
+            return
+        self.attempts = []
+        self.cancel_event.clear()
+        status = "cancelled"
+        try:
+            for attempt in range(1, self.max_retries + 2):
+                if self.cancel_event.is_set():
+                    status = "cancelled"
+                    break
+                status = self.run_attempt(inpb, quiet, progress, attempt)
+                if status in ("completed", "cancelled") or attempt > self.max_retries:
+                    break
+                delay = self.retry_delay(attempt)
+                print(f"### AEM-API v1.3.0:: Run {self.run_id}: Retrying in {delay:g} s...")
+                if self.cancel_event.wait(delay):
+                    status = "cancelled"
+        finally:
+            if self.progress_monitor is not None:
+                self.progress_monitor.close()
+        self.finish_run(status)
+
+    # Method to launch the AEM executable once, enforcing the timeout; returns the attempt status
+    def run_attempt(self, inpb, quiet, progress, attempt):
         # Start timing
         start_time = time.time()
         # Launch AEM and pass input byte string
@@ -705,23 +982,336 @@ class AEM_API:
             out = sp.DEVNULL
         else:
             out = sys.stdout
-        fp = os.path.join(self.AEMHomePath, self.aem_exe_filename)
-        p = sp.Popen(fp, stdin=sp.PIPE, stdout=out, stderr=sp.STDOUT, cwd=self.AEMHomePath)
-        p.communicate(inpb)
+        if self.sandbox:
+            self.create_sandbox()
+        monitor = None
+        timed_out = False
+        try:
+            fp = os.path.join(self.run_dir, self.aem_exe_filename)
+            before = report_stat(os.path.join(self.run_dir, self.report_files[0]))
+            monitor = self.start_progress_monitor(progress)
+            self.process = sp.Popen(fp, stdin=sp.PIPE, stdout=out, stderr=sp.STDOUT, cwd=self.run_dir, **process_group_kwargs())
+            if self.cancel_event.is_set():
+                kill_process_tree(self.process.pid)
+            try:
+                self.process.communicate(inpb, timeout=self.timeout)
+            except sp.TimeoutExpired:
+                timed_out = True
+                kill_process_tree(self.process.pid)
+                self.process.communicate()
+            status, error = self.attempt_outcome(self.process.returncode, timed_out, before)
+            if monitor is not None:
+                monitor.stop(completed=status == "completed", close=False)
+            self.record_attempt(attempt, status, error, self.process.returncode, start_time)
+            if status == "completed":
+                self.copy_report_files()
+        finally:
+            if self.process is not None and self.process.returncode is None:
+                # Interrupted (e.g. KeyboardInterrupt): never leave AEM writing into a sandbox being removed
+                kill_process_tree(self.process.pid)
+                self.process.wait()
+            self.process = None
+            if monitor is not None:
+                monitor.stop(completed=False, close=False)  # no-op unless the attempt was interrupted
+            if self.sandbox:
+                self.remove_sandbox()
+        return status
+
+    # Method to run the AEM model from a running event loop; returns a cancellable asyncio.Task
+    def runAEM_async(self, quiet=True, progress=None):
+        return asyncio.get_running_loop().create_task(self._runAEM_async(quiet, progress))
+
+    async def _runAEM_async(self, quiet, progress=None):
+        print(f"### AEM-API v1.3.0:: Starting Run {self.run_id} (async)...")
+        inpb = self.get_cue_bytes()
+        loop = asyncio.get_running_loop()
+        if await loop.run_in_executor(None, self.load_cached_result):
+            await loop.run_in_executor(None, self.replay_progress, progress)
+            await loop.run_in_executor(None, self.save_run_log)
+            self.run_yet = True
+            return self.run_output_dir
+        self.attempts = []
+        self.cancel_event.clear()
+        status = "cancelled"
+        try:
+            for attempt in range(1, self.max_retries + 2):
+                if self.cancel_event.is_set():
+                    status = "cancelled"
+                    break
+                status = await self._run_attempt_async(inpb, quiet, progress, attempt)
+                if status in ("completed", "cancelled") or attempt > self.max_retries:
+                    break
+                delay = self.retry_delay(attempt)
+                print(f"### AEM-API v1.3.0:: Run {self.run_id}: Retrying in {delay:g} s...")
+                await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            # Still write the run log, synchronously so a second cancellation cannot skip it
+            try:
+                self.finish_run("cancelled")
+            except RuntimeError:
+                pass
+            raise
+        finally:
+            if self.progress_monitor is not None:
+                self.progress_monitor.close()
+        await loop.run_in_executor(None, self.finish_run, status)
+        return self.run_output_dir
+
+    async def _run_attempt_async(self, inpb, quiet, progress, attempt):
+        loop = asyncio.get_running_loop()
+        start_time = time.time()
+        out = asyncio.subprocess.DEVNULL if quiet else None  # None inherits this process' stdout
+        if self.sandbox:
+            await loop.run_in_executor(None, self.create_sandbox)
+        monitor = None
+        timed_out = False
+        try:
+            fp = os.path.join(self.run_dir, self.aem_exe_filename)
+            before = report_stat(os.path.join(self.run_dir, self.report_files[0]))
+            monitor = self.start_progress_monitor(progress)
+            p = self.process = await asyncio.create_subprocess_exec(fp, stdin=asyncio.subprocess.PIPE, stdout=out,
+                                                                    stderr=asyncio.subprocess.STDOUT, cwd=self.run_dir,
+                                                                    **process_group_kwargs())
+            stdin_error = None
+            try:
+                try:
+                    p.stdin.write(inpb)
+                    await p.stdin.drain()
+                except (BrokenPipeError, ConnectionResetError) as error:
+                    stdin_error = error  # AEM exited before reading all the cues
+                p.stdin.close()
+                await asyncio.wait_for(p.wait(), self.timeout)
+            except asyncio.TimeoutError:
+                timed_out = True
+                kill_process_tree(p.pid)
+                await p.wait()
+            except asyncio.CancelledError:
+                if p.returncode is None:
+                    kill_process_tree(p.pid)
+                    await p.wait()
+                self.record_attempt(attempt, "cancelled", "Task cancelled", p.returncode, start_time)
+                raise
+            status, error = self.attempt_outcome(p.returncode, timed_out, before)
+            if stdin_error is not None and status == "completed":
+                status, error = "failed", f"AEM closed its input early: {stdin_error!r}"
+            if monitor is not None:
+                await loop.run_in_executor(None, lambda: monitor.stop(completed=status == "completed", close=False))
+            self.record_attempt(attempt, status, error, p.returncode, start_time)
+            if status == "completed":
+                # Report copying and parsing are blocking, so keep them off the event loop
+                copying = loop.run_in_executor(None, self.copy_report_files)
+                try:
+                    await asyncio.shield(copying)
+                except asyncio.CancelledError:
+                    await copying  # the copy keeps running in its thread; let it finish before the sandbox goes
+                    raise
+        finally:
+            if self.process is not None and self.process.returncode is None:
+                kill_process_tree(self.process.pid)
+                await self.process.wait()
+            self.process = None
+            if monitor is not None:
+                monitor.stop(completed=False, close=False)  # no-op unless the attempt was interrupted
+            if self.sandbox:
+                await loop.run_in_executor(None, self.remove_sandbox)
+        return status
+
+    # Method to cancel a running attempt from another thread: kills the AEM process tree and skips any retries
+    def cancel(self):
+        self.cancel_event.set()
+        process = self.process
+        if process is not None and process.returncode is None:
+            print(f"### AEM-API v1.3.0:: Run {self.run_id}: Cancelling...")
+            kill_process_tree(process.pid)
+
+    # Method to classify a finished attempt; a zero exit code alone is not trusted, Report1 must also have been written
+    def attempt_outcome(self, returncode, timed_out, before):
+        if self.cancel_event.is_set():
+            return "cancelled", "Run cancelled"
+        if timed_out:
+            return "timeout", f"AEM did not finish within {self.timeout} s"
+        if returncode != 0:
+            return "failed", f"AEM exited with return code {returncode}"
+        after = report_stat(os.path.join(self.run_dir, self.report_files[0]))
+        if after is None or after == before:
+            return "failed", f"{self.report_files[0]} was not written"
+        if after[1] == 0:
+            return "failed", f"{self.report_files[0]} is empty"
+        return "completed", None
+
+    def record_attempt(self, attempt, status, error, returncode, start_time):
+        runtime = time.time() - start_time
+        self.attempts.append({"attempt": attempt, "status": status, "returncode": returncode, "error": error, "runtime": runtime})
         #End timing and print completion with runtime
-        end_time = time.time()
-        runtime = (end_time - start_time)
-        hours = int(runtime // 3600)
-        minutes = int((runtime % 3600) // 60)
-        seconds = int(runtime % 60)
-        milliseconds = int((runtime % 1) * 1000)  # Convert fractional seconds to milliseconds
-        # Format runtime to HH:MM:SS.mmm
-        runtime_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
-        print(f"### AEM-API v1.3.0:: Run {self.run_id} Complete! (Runtime: {runtime_str})")
-        self.copy_report_files()
+        runtime_str = format_runtime(runtime)
+        if status == "completed":
+            print(f"### AEM-API v1.3.0:: Run {self.run_id} Complete! (Runtime: {runtime_str})")
+        else:
+            print(f"### AEM-API v1.3.0:: Run {self.run_id}: Attempt {attempt} {status}: {error} (Runtime: {runtime_str})")
+
+    # Method to compute the exponential backoff before retry number `attempt`
+    def retry_delay(self, attempt):
+        return self.retry_backoff * 2 ** (attempt - 1)
+
+    # Method to cache, log and close a run; raises RuntimeError if no attempt completed
+    def finish_run(self, status):
+        if status == "completed":
+            self.store_cached_result()
         self.save_run_log()
+        if status != "completed":
+            error = self.attempts[-1]["error"] if self.attempts else "Run cancelled"
+            raise RuntimeError(f"AEM run {self.run_id} {status} after {len(self.attempts)} attempt(s): {error}")
         self.run_yet = True
+
+    # Method to estimate the number of 'alt = ' blocks per report; None when the executable enumerates compositions itself
+    def expected_blocks(self):
+        if self.solventcomp == 2 or (len(self.electrolyte.salts) > 1 and self.saltcomp != 1):
+            return None
+        if None in (self.tmin, self.tmax, self.stepsize):
+            return None
+        return int(round((self.tmax - self.tmin) / self.stepsize)) + 1
+
+    # Method to start tailing the run directory; progress is a callback or an AEM_ProgressMonitor
+    def start_progress_monitor(self, progress, run_dir=None, replay=False):
+        if progress is None:
+            return None
+        monitor = progress if isinstance(progress, AEM_ProgressMonitor) else AEM_ProgressMonitor(callback=progress)
+        self.progress_monitor = monitor.start(run_dir or self.run_dir, self.report_files, self.expected_blocks(), replay)
+        return monitor
+
+    # Method to report the blocks of cached Reports to a progress monitor, as if the run had produced them
+    def replay_progress(self, progress):
+        monitor = self.start_progress_monitor(progress, os.path.join(self.run_output_dir, "Reports"), replay=True)
+        if monitor is not None:
+            monitor.stop()
+
+    # Method to encode the generated cues as the input byte string expected by the AEM executable
+    def get_cue_bytes(self):
+        if not self.cues:
+            raise ValueError("cues not populated, run generate_cues first")
+        inp = [str(cue) for cue in self.cues]
+        print(f"### AEM-API v1.3.0:: Cues: {inp}...")
+        return bytes('\n'.join(inp) + '\n\n', encoding="ascii")
+
+    # Method to restore Reports from the result cache; returns True on a cache hit
+    def load_cached_result(self):
+        if self.result_cache is None:
+            return False
+        self.cache_key = self.result_cache.key_for(self)
+        self.cache_hit = self.result_cache.get(self.cache_key, os.path.join(self.run_output_dir, "Reports"))
+        if self.cache_hit:
+            print(f"### AEM-API v1.3.0:: Run {self.run_id}: Restored Reports from result cache (key {self.cache_key[:12]})")
+        return self.cache_hit
+
+    # Method to store this run's Reports in the result cache
+    def store_cached_result(self):
+        if self.result_cache is None or self.cache_key is None:
+            return
+        self.result_cache.put(self.cache_key, os.path.join(self.run_output_dir, "Reports"), self.cues)
     
+    # Method to enumerate the fixed solvent compositions (mass %) spanned by a matrix (solventcomp=2) run
+    def matrix_compositions(self, matrix_step=0.1):
+        solvents = list(self.electrolyte.solvents.keys())
+        units = int(round(1.0 / matrix_step))
+        cmf_index = None
+        if self.cmfoption == 1 and len(solvents) > 2:
+            cmf_index = self.cmfsolventindex if self.cmfsolventindex is not None else 0
+            cmf_fraction = float(self.electrolyte.solvents[solvents[cmf_index]])
+            if cmf_fraction > 1:
+                cmf_fraction /= 100.0  # constant mass fraction given in percent
+        free = [solvent for i, solvent in enumerate(solvents) if i != cmf_index]
+        remaining = 1.0 if cmf_index is None else 1.0 - cmf_fraction
+        compositions = []
+        for parts in positive_partitions(units, len(free)):
+            composition = {solvent: round(100.0 * remaining * part / units, 6) for solvent, part in zip(free, parts)}
+            if cmf_index is not None:
+                composition[solvents[cmf_index]] = round(100.0 * cmf_fraction, 6)
+                composition = {solvent: composition[solvent] for solvent in solvents}
+            compositions.append(composition)
+        return compositions
+
+    # Method to execute sub-runs in parallel and merge their reports into this run
+    def run_split(self, subrun_params, max_workers=None, quiet=True, sort_blocks=False, keep_subruns=False, allow_partial=False,
+                  exclude_reports=()):
+        if not self.cues:
+            raise ValueError("cues not populated, run generate_cues first")
+        subrun_dir = os.path.join(self.run_output_dir, "SubRuns")
+        jobs = []
+        for i, overrides in enumerate(subrun_params):
+            params = dict(self.init_params)
+            params.update(overrides)
+            electrolyte = params.pop("electrolyte")
+            params.update(output_dir=subrun_dir, run_name=f"SubRun{i:04d}", sandbox=True, results_db=None, archive_compression=None)
+            jobs.append((electrolyte, params))
+        start_time = time.time()
+        results = run_many(jobs, max_workers=max_workers, quiet=quiet, parse_reports=False)
+        self.subruns = []
+        for result, overrides in zip(results, subrun_params):
+            self.subruns.append({
+                "index": result["index"],
+                "run_id": result["run_id"],
+                "status": result["status"],
+                "error": result["error"],
+                "runtime": result["runtime"],
+                "electrolyte_composition": overrides["electrolyte"].CompositionID if "electrolyte" in overrides else None,
+                "overrides": {k: v for k, v in overrides.items() if k != "electrolyte"}
+            })
+        completed = [r for r in results if r["status"] == "completed"]
+        failed = [r for r in results if r["status"] != "completed"]
+        if failed and (not completed or not allow_partial):
+            # Like finish_run: log the sub-run outcomes, then raise; the sub-run folders are kept for inspection
+            self.save_run_log()
+            errors = "; ".join(f"SubRun{r['index']:04d} {r['status']}: {r['error']}" for r in failed)
+            raise RuntimeError(f"AEM run {self.run_id}: {len(failed)} of {len(results)} sub-runs failed: {errors}")
+        if failed:
+            print(f"### AEM-API v1.3.0:: Run {self.run_id}: {len(failed)} of {len(results)} sub-runs failed, merging the rest")
+        dstfolder = os.path.join(self.run_output_dir, "Reports")
+        if exclude_reports:
+            print(f"### AEM-API v1.3.0:: Run {self.run_id}: Not merging {', '.join(exclude_reports)} (fitted per temperature range)")
+        merge_report_files([os.path.join(r["run_output_dir"], "Reports") for r in completed], dstfolder, sort_blocks=sort_blocks,
+                           exclude=exclude_reports)
+        self.parsed_run = aem_convert(dstfolder, ("csv", "json"), parse_workers=self.parse_workers, cache=True)
+        if not keep_subruns:
+            shutil.rmtree(subrun_dir, ignore_errors=True)
+        runtime_str = format_runtime(time.time() - start_time)
+        print(f"### AEM-API v1.3.0:: Run {self.run_id} Complete! ({len(completed)} sub-runs merged, Runtime: {runtime_str})")
+        self.save_run_log()
+        self.run_yet = True
+
+    # Method to run a matrix (solventcomp=2) run as parallel fixed-composition sub-runs
+    def runAEM_matrix_split(self, matrix_step=0.1, temperature_shards=1, max_workers=None, quiet=True, keep_subruns=False, allow_partial=False):
+        if self.solventcomp != 2:
+            raise ValueError("runAEM_matrix_split requires solventcomp=2 (matrix mode)")
+        if self.number_of_accc_solvents:
+            raise ValueError("runAEM_matrix_split does not support ACCC solvents")
+        temperature_ranges = split_temperature_range(self.tmin, self.tmax, self.stepsize, temperature_shards)
+        subrun_params = []
+        for composition in self.matrix_compositions(matrix_step):
+            electrolyte = ElectrolyteComposition.translate_electrolyte(solvents=composition, salts=dict(self.electrolyte.salts))
+            for tmin, tmax in temperature_ranges:
+                subrun_params.append({
+                    "electrolyte": electrolyte,
+                    "number_of_total_solvents": len(composition),
+                    "solventcomp": 1,
+                    "solventcomppropbasis": 2,  # matrix compositions are mass fractions
+                    "cmfoption": None,
+                    "cmfsolventindex": None,
+                    "tmin": tmin,
+                    "tmax": tmax
+                })
+        print(f"### AEM-API v1.3.0:: Run {self.run_id}: Splitting matrix run into {len(subrun_params)} fixed-composition sub-runs...")
+        self.run_split(subrun_params, max_workers=max_workers, quiet=quiet, sort_blocks=len(temperature_ranges) > 1, keep_subruns=keep_subruns,
+                       allow_partial=allow_partial, exclude_reports=TEMPERATURE_FITTED_REPORTS if len(temperature_ranges) > 1 else ())
+
+    # Method to run the temperature sweep as parallel temperature-range sub-runs stitched back into one run
+    def runAEM_sharded(self, temperature_shards=None, max_workers=None, quiet=True, keep_subruns=False, allow_partial=False):
+        shards = temperature_shards or max_workers or os.cpu_count() or 1
+        temperature_ranges = split_temperature_range(self.tmin, self.tmax, self.stepsize, shards)
+        subrun_params = [{"electrolyte": self.electrolyte, "tmin": tmin, "tmax": tmax} for tmin, tmax in temperature_ranges]
+        print(f"### AEM-API v1.3.0:: Run {self.run_id}: Sharding {self.tmin}..{self.tmax} C into {len(subrun_params)} temperature ranges: {temperature_ranges}")
+        self.run_split(subrun_params, max_workers=max_workers, quiet=quiet, sort_blocks=True, keep_subruns=keep_subruns,
+                       allow_partial=allow_partial, exclude_reports=TEMPERATURE_FITTED_REPORTS if len(temperature_ranges) > 1 else ())
+
     # Function to log run summary
     def save_run_log(self):
         if self.run_name is None:
@@ -730,7 +1320,7 @@ class AEM_API:
                 "run_date": self.run_date,
                 "run_time": self.run_time,
                 "electrolyte_composition": self.electrolyte.CompositionID if self.electrolyte is not None else None,
-                "ACCC_electrolyte_composition": self.accc_electrolyte.CompositionID if self.accc_electrolyte is not None else None,
+                #"ACCC_electrolyte_composition": self.accc_electrolyte.CompositionID if self.accc_electrolyte is not None else None,
                 "input_params": self.params
             }
             log_file = os.path.join(self.run_output_dir, f"AEMRun-{self.run_id}-{self.run_date}-{self.run_time}-Log.json")
@@ -747,10 +1337,25 @@ class AEM_API:
             }
             log_file = os.path.join(self.run_output_dir, f"AEMRun-{self.run_name}-{self.run_date}-{self.run_time}-Log.json")
             print(f"### AEM-API v1.3.0:: Run {self.run_name}: Log saved to {log_file}")
+        if self.subruns is not None:
+            log_data["subruns"] = self.subruns
+        if self.attempts:
+            log_data["attempts"] = self.attempts
+        if self.cache_key is not None:
+            log_data["result_cache"] = {"key": self.cache_key, "hit": self.cache_hit}
         os.makedirs(os.path.dirname(log_file), exist_ok=True)
         with open(log_file, 'w') as f:
             json.dump(log_data, f, indent=4)
+        if self.results_db is not None and os.path.isdir(os.path.join(self.run_output_dir, "Reports")):
+            self.results_db.ingest(self.run_output_dir, run=self.parsed_run, log=log_data)
+            print(f"### AEM-API v1.3.0:: Run {self.run_id}: Reports ingested into {self.results_db.path}")
+        if self.archive_compression is not None and os.path.isdir(os.path.join(self.run_output_dir, "Reports")):
+            self.archive_reports(self.archive_compression)
         return None
+
+    # Method to pack the Reports folder into one compressed archive (Reports.zip / Reports.tar); returns its path
+    def archive_reports(self, compression="zip", remove=True):
+        return archive_reports(os.path.join(self.run_output_dir, "Reports"), compression, remove=remove)
     
     # Function to copy report files to run_output_dir
     def copy_report_files(self):
@@ -762,7 +1367,7 @@ class AEM_API:
             print(f"### AEM-API v1.3.0:: Run {self.run_id}: Failed to create destination folder {dstfolder}: {e}")
             return
         for report_file in self.report_files:
-            src = os.path.join(self.AEMHomePath, report_file)
+            src = os.path.join(self.run_dir, report_file)
             dst = os.path.join(dstfolder, report_file)  # Removed f-string, as it’s unnecessary
             print(f"### AEM-API v1.3.0:: Run {self.run_id}: Copying from {src} to {dst}")
             if os.path.exists(src):
@@ -779,9 +1384,8 @@ class AEM_API:
                 print(f"### AEM-API v1.3.0:: Run {self.run_id}: Report file {report_file} not found at {src}")
         print(f"### AEM-API v1.3.0:: Run {self.run_id}: Copied generated Report files to {dstfolder}")
         print(f"### AEM-API v1.3.0:: Run {self.run_id}: Running AEM-PARSER on Report files and converting to .csv and .json...")
-        aem_convert_to_csv(dstfolder)
+        self.parsed_run = aem_convert(dstfolder, ("csv", "json"), parse_workers=self.parse_workers, cache=True)
         print(f"### AEM-API v1.3.0:: Run {self.run_id}: AEM-PARSER converted Report files to .csv and saved to {dstfolder}\\csv")
-        aem_convert_to_json(dstfolder)
         print(f"### AEM-API v1.3.0:: Run {self.run_id}: AEM-PARSER converted Report files to .json and saved to {dstfolder}\\json")
 
     # Function to preview data from parsed report files
@@ -794,13 +1398,16 @@ class AEM_API:
             print(f"### AEM-API v1.3.0:: Plotting {y} v/s {x} from {report_number} for Run {self.run_id}...")
         else:
             print(f"### AEM-API v1.3.0:: Plotting {y} v/s {x} from {report_number} for Run {self.run_name}...")
-        run = aem_run()
-        run.parse_run(output_dir)
+        run = self.parsed_run
+        if run is None:
+            run = aem_run(locateReports(output_dir), cache=True)  # parses (or loads from Reports/parsed) only the report being plotted
+            self.parsed_run = run
         fig, ax = plt.subplots(figsize=(20, 6))
         report = getattr(run, report_number.lower())  # Access report dynamically based on input
         for s in report.items:
-            x_plot = [d[x] for d in s.data]
-            y_plot = [d[y] for d in s.data]
+            rows = report.item_rows(s)
+            x_plot = [d[x] for d in rows]
+            y_plot = [d[y] for d in rows]
             # Generate label with information about solvents, salts, and temperature
             label = (f"Solvent(s): {s.solvents_str_no_comma()}\n"
                      f"Salt(s): {s.salts_str_no_comma()}\n"
@@ -826,3 +1433,502 @@ class AEM_API:
             print(f"### AEM-API v1.3.0:: {y} v/s {x} from {report_number} for Run {self.run_name} saved as a data plot to '{plot_path}'")
         print(f"### AEM-API v1.3.0:: End of Program! (© 2024 Ridgetop Group, Inc. and Adarsh Dave (CMU), All Rights Reserved)")
 
+
+## RESULT CACHE
+DEFAULT_CACHE_DIR = os.path.join(API_HOME_PATH, "AEM-API-Cache")
+DEFAULT_CACHE_MAX_BYTES = 10 * 1024 ** 3  # 10 GB
+_executable_digests = {}
+
+def canonical_cue(cue):
+    """Render a cue so that equivalent inputs (e.g. 1, 1.0 and "1.0") hash identically."""
+    if isinstance(cue, bool):
+        return str(int(cue))
+    try:
+        return format(float(cue), ".12g")
+    except (TypeError, ValueError):
+        return str(cue).strip()
+
+def executable_digest(path):
+    """SHA-256 of an executable, memoized on its path, size and modification time."""
+    st = os.stat(path)
+    memo_key = (os.path.realpath(path), st.st_size, st.st_mtime_ns)
+    if memo_key not in _executable_digests:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        _executable_digests[memo_key] = h.hexdigest()
+    return _executable_digests[memo_key]
+
+## AEM_ResultCache CLASS
+class AEM_ResultCache:
+    """On-disk, size-capped LRU cache of Reports directories keyed by the canonical cue deck.
+
+    The key covers the canonicalized cues, the AEM executable (by content hash) and the DLM mode. Inputs the
+    executable never reads (e.g. SCAEP fields with scaep=0) are not part of the cue deck, so they never change the key.
+    """
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def key_for(self, aem):
+        exe = os.path.join(aem.AEMHomePath, aem.aem_exe_filename)
+        deck = {
+            "cues": [canonical_cue(cue) for cue in aem.cues],
+            "executable": executable_digest(exe) if os.path.isfile(exe) else aem.aem_exe_filename,
+            "dlm": aem.dlmout
+        }
+        return hashlib.sha256(json.dumps(deck, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def get(self, key, dstfolder):
+        entry = self.entry_path(key)
+        src = os.path.join(entry, "Reports")
+        if not os.path.isdir(src):
+            return False
+        # Plain copies: a link into the cache would let edits to the run's Reports corrupt the entry
+        for dirpath, _, filenames in os.walk(src):
+            rel = os.path.relpath(dirpath, src)
+            dst_dir = dstfolder if rel == os.curdir else os.path.join(dstfolder, rel)
+            os.makedirs(dst_dir, exist_ok=True)
+            for filename in filenames:
+                shutil.copy2(os.path.join(dirpath, filename), os.path.join(dst_dir, filename))
+        try:
+            os.utime(os.path.join(entry, "entry.json"))  # mark as most recently used
+        except OSError:
+            pass
+        return True
+
+    def put(self, key, srcfolder, cues=None):
+        entry = self.entry_path(key)
+        if os.path.isdir(entry):
+            return
+        # Only cache runs that actually produced output
+        if not any(os.path.isfile(os.path.join(srcfolder, r)) and os.path.getsize(os.path.join(srcfolder, r)) > 0
+                   for r in AEM_API.report_files):
+            return
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        tmp = tempfile.mkdtemp(prefix=".tmp-", dir=self.cache_dir)
+        try:
+            shutil.copytree(srcfolder, os.path.join(tmp, "Reports"))
+            size = sum(os.path.getsize(os.path.join(dp, f)) for dp, _, fs in os.walk(tmp) for f in fs)
+            with open(os.path.join(tmp, "entry.json"), "w") as f:
+                json.dump({"key": key, "cues": None if cues is None else [canonical_cue(c) for c in cues],
+                           "created": datetime.datetime.now().isoformat(), "size": size}, f, indent=4)
+            os.replace(tmp, entry)  # atomic publish; another process may have won the race
+        except OSError:
+            pass
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.evict()
+
+    def entries(self):
+        """Return (last_used, size, path) for every cache entry."""
+        found = []
+        for prefix in os.listdir(self.cache_dir):
+            prefix_dir = os.path.join(self.cache_dir, prefix)
+            if prefix.startswith(".") or not os.path.isdir(prefix_dir):
+                continue
+            for key in os.listdir(prefix_dir):
+                meta = os.path.join(prefix_dir, key, "entry.json")
+                try:
+                    with open(meta) as f:
+                        size = json.load(f).get("size", 0)
+                    found.append((os.path.getmtime(meta), size, os.path.join(prefix_dir, key)))
+                except (OSError, ValueError):
+                    continue
+        return found
+
+    def evict(self):
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        while entries and total > self.max_bytes:
+            _, size, path = entries.pop(0)  # least recently used first
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        for _, _, path in self.entries():
+            shutil.rmtree(path, ignore_errors=True)
+
+## RESULTS DATABASE
+DEFAULT_RESULTS_DB = os.path.join(API_HOME_PATH, "AEM-API-Results.sqlite")
+
+## AEM_ResultsDB CLASS
+class AEM_ResultsDB:
+    """Local SQLite database of parsed report rows across runs, for fast cross-run lookups.
+
+    A `runs` table holds one row per run (keyed by the run_id of its run log), and each report type has a
+    table reportXX with the run_id, the block index and the report's columns, indexed on composition,
+    temperature and m2. The connection is opened lazily, so the object can be passed to run_many workers.
+    """
+    def __init__(self, path=DEFAULT_RESULTS_DB):
+        self.path = path
+        self._conn = None
+        self._tables = {}
+
+    def __getstate__(self):
+        return {"path": self.path, "_conn": None, "_tables": {}}
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, timeout=60)
+            self._conn.execute("PRAGMA journal_mode=WAL")  # readers are not blocked by an ingest
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""CREATE TABLE IF NOT EXISTS runs (run_id TEXT PRIMARY KEY, run_name TEXT, run_date TEXT,
+                                  run_time TEXT, electrolyte_composition TEXT, run_output_dir TEXT, log TEXT)""")
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @staticmethod
+    def report_columns(number):
+        """Columns of the reportXX table: the union of the report's layouts over all AEM versions."""
+        columns = []
+        for layout, _ in REPORT_SPECS[number].layouts:
+            columns += [c for c in layout if c not in columns]
+        return columns
+
+    def table(self, number):
+        """Create the table and indexes of report number if needed; return (table name, columns)."""
+        if number not in self._tables:
+            name = f"report{number:02d}"
+            columns = self.report_columns(number)
+            types = ["TEXT" if c in ("solvent_comp", "salt_comp") else "REAL" for c in columns]
+            definition = ", ".join(f'"{c}" {t}' for c, t in zip(columns, types))
+            self.conn.execute(f'CREATE TABLE IF NOT EXISTS {name} (run_id TEXT NOT NULL, block INTEGER, {definition})')
+            self.conn.execute(f'CREATE INDEX IF NOT EXISTS {name}_run ON {name} (run_id)')
+            self.conn.execute(f'CREATE INDEX IF NOT EXISTS {name}_composition ON {name} (salt_comp, solvent_comp, temperature)')
+            self.conn.execute(f'CREATE INDEX IF NOT EXISTS {name}_temperature ON {name} (temperature)')
+            if "m2" in columns:
+                self.conn.execute(f'CREATE INDEX IF NOT EXISTS {name}_m2 ON {name} (m2)')
+            self._tables[number] = (name, columns)
+        return self._tables[number]
+
+    @staticmethod
+    def read_log(run_output_dir):
+        """Return the most recent run log (AEMRun-*-Log.json) in a run output folder."""
+        logs = [os.path.join(run_output_dir, f) for f in os.listdir(run_output_dir) if f.startswith("AEMRun-") and f.endswith("-Log.json")]
+        if not logs:
+            raise FileNotFoundError(f"no run log in {run_output_dir}")
+        with open(max(logs, key=os.path.getmtime)) as f:
+            return json.load(f)
+
+    def ingest(self, run_output_dir, run=None, log=None):
+        """Load the reports of one run into the database, replacing any rows of the same run_id.
+
+        `run` is an already parsed aem_run (the reports in run_output_dir/Reports are parsed otherwise)
+        and `log` the run log dict (read from run_output_dir otherwise). Returns the run_id.
+        """
+        log = log if log is not None else self.read_log(run_output_dir)
+        run = run if run is not None else aem_run(locateReports(os.path.join(run_output_dir, "Reports")), cache=True)
+        run_id = log["run_id"]
+        with self.conn:  # one transaction per run
+            self.conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+            self.conn.execute("INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                              (run_id, log.get("run_name"), log.get("run_date"), log.get("run_time"), log.get("electrolyte_composition"),
+                               os.path.abspath(run_output_dir), json.dumps(log, default=str)))
+            for number in REPORT_SPECS:
+                report = getattr(run, f"report{number:02d}")
+                if not report.exists:
+                    continue
+                name, columns = self.table(number)
+                self.conn.execute(f"DELETE FROM {name} WHERE run_id = ?", (run_id,))
+                rows = ((run_id, block, *[row.get(c) for c in columns])
+                        for block, item in enumerate(report.items) for row in report.item_rows(item))
+                self.conn.executemany(f"INSERT INTO {name} VALUES ({', '.join('?' * (len(columns) + 2))})", rows)
+        return run_id
+
+    def ingest_tree(self, root):
+        """Ingest every run output folder (one holding a run log and a Reports folder) below root; return their run_ids."""
+        run_ids = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            has_reports = "Reports" in dirnames or "Reports.zip" in filenames or "Reports.tar" in filenames
+            if has_reports and any(f.startswith("AEMRun-") and f.endswith("-Log.json") for f in filenames):
+                run_ids.append(self.ingest(dirpath))
+                dirnames[:] = []  # sub-runs were merged into this run
+        return run_ids
+
+    def query(self, report_number, columns=None, where=None, params=(), limit=None, **filters):
+        """Return matching rows of one report type across all ingested runs as a DataFrame.
+
+        Keyword filters compare a column with a value: a string containing '%' matches with LIKE, a
+        (low, high) tuple is an inclusive range, anything else must be equal. `where` adds raw SQL with
+        `params`, e.g. query(1, salt_comp="%LiPF6%", temperature=25, where="spec_cond > ?", params=(10,)).
+        """
+        name, table_columns = self.table(report_number)
+        known = ["run_id", "block"] + table_columns
+        clauses, values = [], []
+        for column, value in filters.items():
+            if column not in known:
+                raise ValueError(f"{name} has no column {column!r}")
+            if isinstance(value, tuple):
+                clauses.append(f'"{column}" BETWEEN ? AND ?')
+                values += list(value)
+            elif isinstance(value, str) and "%" in value:
+                clauses.append(f'"{column}" LIKE ?')
+                values.append(value)
+            else:
+                clauses.append(f'"{column}" = ?')
+                values.append(value)
+        if where:
+            clauses.append(f"({where})")
+            values += list(params)
+        if isinstance(columns, str):
+            columns = [columns]
+        for column in columns or []:
+            if column not in known:
+                raise ValueError(f"{name} has no column {column!r}")
+        select = "*" if columns is None else ", ".join(f'"{c}"' for c in columns)
+        sql = f"SELECT {select} FROM {name}"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return pd.read_sql_query(sql, self.conn, params=values)
+
+    def runs(self):
+        """Return the ingested runs as a DataFrame."""
+        return pd.read_sql_query("SELECT run_id, run_name, run_date, run_time, electrolyte_composition, run_output_dir FROM runs", self.conn)
+
+## AEM_ProgressMonitor CLASS
+class AEM_ProgressMonitor:
+    """Tails the report files of a running AEM executable and publishes each completed 'alt = ' block.
+
+    Every event is a dict with the report name, block and row counts, rows per second, ETA and the block text.
+    Events are passed to `callback` from the monitor thread. A monitor without a callback queues them
+    instead, to be consumed by iterating it; the iteration ends once the run has finished.
+    """
+    def __init__(self, callback=None, interval=0.5, report_files=None, expected_blocks=None):
+        self.callback = callback
+        self.interval = interval
+        self.report_files = report_files
+        self.expected_blocks = expected_blocks
+        self.events = queue.Queue() if callback is None else None  # nothing would drain it in callback mode
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.run_dir = None
+        self.stale = {}
+        self.started_at = None
+        self.closed = False
+        self.tails = {}
+        self.blocks = {}
+        self.rows = {}
+
+    # Method to start tailing run_dir; report files already there are stale and ignored until rewritten, unless replaying them
+    def start(self, run_dir, report_files=None, expected_blocks=None, replay=False):
+        self.run_dir = run_dir
+        if self.report_files is None:
+            self.report_files = list(report_files or [])
+        if self.expected_blocks is None:
+            self.expected_blocks = expected_blocks
+        self.started_at = time.time()
+        self.stale = {} if replay else {name: report_stat(os.path.join(run_dir, name)) for name in self.report_files}
+        self.closed = False
+        self.tails = {name: {"offset": 0, "pending": "", "active": False} for name in self.report_files}
+        self.blocks = dict.fromkeys(self.report_files, 0)
+        self.rows = dict.fromkeys(self.report_files, 0)
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.watch, name="AEM_ProgressMonitor", daemon=True)
+        self.thread.start()
+        return self
+
+    # Method to stop tailing; with completed=True the last block of each report is published as well
+    def stop(self, completed=True, close=True):
+        if self.thread is not None:
+            self.stop_event.set()
+            self.thread.join()
+            self.thread = None
+            self.poll(final=completed)
+        if close:
+            self.close()
+
+    # Method to end iteration over the monitor's events (a retried run keeps the monitor open between attempts)
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            if self.events is not None:
+                self.events.put(None)
+
+    def watch(self):
+        while not self.stop_event.wait(self.interval):
+            self.poll()
+
+    # Method to read newly written report text and publish the blocks it completes
+    def poll(self, final=False):
+        for name in self.report_files:
+            tail = self.tails[name]
+            path = os.path.join(self.run_dir, name)
+            stat = report_stat(path)
+            if stat is None:
+                continue
+            if not tail["active"]:
+                if stat == self.stale.get(name):
+                    continue  # stale report left in the AEM home by an earlier run
+                tail["active"] = True
+            size = stat[1]
+            if size < tail["offset"]:
+                tail["offset"], tail["pending"] = 0, ""  # report was rewritten from the start
+            if size > tail["offset"]:
+                with open(path, 'rb') as f:
+                    f.seek(tail["offset"])
+                    data = f.read()
+                tail["offset"] += len(data)
+                tail["pending"] += data.decode(errors="replace")
+            self.publish_blocks(name, final)
+
+    def publish_blocks(self, name, final):
+        tail = self.tails[name]
+        text = tail["pending"]
+        # Only whole lines count, so a block is complete once the next block's 'alt = ' line has been written
+        end = len(text) if final else text.rfind('\n') + 1
+        header, blocks = splitReportText(text[:end])
+        if not blocks:
+            return
+        complete = blocks if final else blocks[:-1]
+        tail["pending"] = text[len(header) + sum(len(block) for block in complete):]
+        for block in complete:
+            rows = self.count_rows(block)
+            self.blocks[name] += 1
+            self.rows[name] += rows
+            self.publish(name, block, rows)
+
+    @staticmethod
+    def count_rows(block):
+        """Count the data rows below the last dashed separator of a report block."""
+        lines = block.splitlines()
+        separators = [i for i, line in enumerate(lines) if line.strip() and not line.strip().strip('-')]
+        if not separators:
+            return 0
+        return sum(1 for line in lines[separators[-1] + 1:] if line.strip())
+
+    def publish(self, name, block, rows):
+        elapsed = time.time() - self.started_at
+        blocks = self.blocks[name]
+        expected = self.expected_blocks
+        composition, temperature = reportBlockKey(block)
+        event = {
+            "report": name,
+            "blocks": blocks,
+            "expected_blocks": expected,
+            "fraction": min(blocks / expected, 1.0) if expected else None,
+            "block_rows": rows,
+            "rows": self.rows[name],
+            "rows_per_sec": self.rows[name] / elapsed if elapsed > 0 else None,
+            "elapsed": elapsed,
+            "eta": max(expected - blocks, 0) * elapsed / blocks if expected else None,
+            "composition": composition if temperature is not None else None,
+            "temperature": temperature,
+            "block": block
+        }
+        if self.events is not None:
+            self.events.put(event)
+        if self.callback is not None:
+            try:
+                self.callback(event)
+            except Exception as e:
+                print(f"### AEM-API v1.3.0:: Progress callback failed on {name} block {blocks}: {e}")
+
+    def __iter__(self):
+        if self.events is None:
+            raise TypeError("an AEM_ProgressMonitor with a callback is not iterable")
+        while True:
+            event = self.events.get()
+            if event is None:
+                return
+            yield event
+
+## BATCH RUNNER
+# Function executed in a worker process for each job submitted by run_many
+def _run_batch_job(index, electrolyte, params, quiet, parse_reports):
+    result = {
+        "index": index,
+        "run_id": None,
+        "run_name": params.get("run_name"),
+        "run_output_dir": None,
+        "status": "failed",
+        "error": None,
+        "runtime": None,
+        "reports": None
+    }
+    start_time = time.time()
+    try:
+        aem = AEM_API(electrolyte=electrolyte, **params)
+        result["run_id"] = aem.run_id
+        result["run_output_dir"] = aem.run_output_dir
+        aem.generate_cues()
+        aem.runAEM(quiet=quiet)
+        if parse_reports:
+            run = aem.parsed_run  # already parsed by the conversion unless restored from the result cache
+            if run is None:
+                run = aem_run()
+                run.parse_run(locateReports(os.path.join(aem.run_output_dir, "Reports")), cache=True)
+            result["reports"] = run
+        result["status"] = "completed"
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["runtime"] = time.time() - start_time
+    return result
+
+def iter_run_many(jobs, max_workers=None, quiet=True, sandbox=True, parse_reports=True):
+    """Yield one result dict per (ElectrolyteComposition, parameter dict) job, in completion order.
+
+    Each parameter dict holds the AEM_API constructor arguments of one run. Jobs are drawn lazily
+    from `jobs`, so a generator of thousands of formulations never has more than a few runs queued.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    jobs = enumerate(jobs)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}
+        def submit_next():
+            try:
+                index, (electrolyte, params) = next(jobs)
+            except StopIteration:
+                return False
+            params = dict(params)
+            params.setdefault("sandbox", sandbox)  # runs share one AEM home, so isolate them by default
+            # Check the licence once here so the workers find it in the on-disk cache
+            check_dlm_access(params.get("AEMHomePath"))
+            future = executor.submit(_run_batch_job, index, electrolyte, params, quiet, parse_reports)
+            pending[future] = (index, params.get("run_name"))
+            return True
+        for _ in range(2 * max_workers):
+            if not submit_next():
+                break
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, run_name = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:  # worker process died (e.g. BrokenProcessPool)
+                    result = {"index": index, "run_id": None, "run_name": run_name, "run_output_dir": None,
+                              "status": "failed", "error": f"{type(e).__name__}: {e}", "runtime": None, "reports": None}
+                submit_next()
+                yield result
+
+def run_many(jobs, max_workers=None, quiet=True, sandbox=True, parse_reports=True, callback=None):
+    """Run a sweep of (ElectrolyteComposition, parameter dict) jobs over a pool of worker processes.
+
+    Returns the result dicts (index, run_id, run_name, run_output_dir, status, error, runtime and the
+    parsed aem_run under "reports") sorted by job index; `callback` is called with each result as it completes.
+    """
+    results = []
+    print(f"### AEM-API v1.3.0:: Starting batch of runs on {max_workers or os.cpu_count()} worker(s)...")
+    for result in iter_run_many(jobs, max_workers=max_workers, quiet=quiet, sandbox=sandbox, parse_reports=parse_reports):
+        print(f"### AEM-API v1.3.0:: Batch job {result['index']} {result['status']}" + (f": {result['error']}" if result["error"] else ""))
+        if callback is not None:
+            callback(result)
+        results.append(result)
+    results.sort(key=lambda r: r["index"])
+    completed = sum(1 for r in results if r["status"] == "completed")
+    print(f"### AEM-API v1.3.0:: Batch complete! ({completed}/{len(results)} runs completed)")
+    return results
+
@@ -4,12 +4,29 @@
 # ============================================================================
 
 ## Import Libraries
+import gzip
+import hashlib
+import io
 import os
+import itertools
 import json
+import locale
+import lzma
+import mmap
+import operator
+import pickle
+import shutil
 import sys
+import tarfile
+import tempfile
 import threading
 import time
+import zipfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from typing import List
+import numpy as np
+import pandas as pd
 
 SOLVENT_ABBREVIATIONS = {
     "water": "water",
@@ -74,33 +91,133 @@ SOLVENT_ABBREVIATIONS = {
 }
 
 ## aem_run CLASS
+def reportProperty(number):
+    """Attribute for reportXX of aem_run, parsed from its report file on first access."""
+    def get(self):
+        return self.load_report(number)
+    def set(self, report):
+        self._reports[number] = report
+        self._report_mtimes[number] = None  # assigned, not loaded from report_paths
+    return property(get, set, doc=f"aem_report{number:02d} of this run, parsed on first access")
+
 class aem_run:
-    def __init__(self):
+    """Parsed reports of one run.
+
+    Given a Reports directory, the report files are only located on construction; each reportXX
+    attribute is parsed on first access and kept. With check_mtime, a report whose file has changed
+    since it was parsed is parsed again on its next access. parse_run() parses every report at once.
+    """
+    report01 = reportProperty(1)
+    report02 = reportProperty(2)
+    report03 = reportProperty(3)
+    report04 = reportProperty(4)
+    report05 = reportProperty(5)
+    report06 = reportProperty(6)
+    report10 = reportProperty(10)
+    report11 = reportProperty(11)
+    report12 = reportProperty(12)
+    report13 = reportProperty(13)
+    report14 = reportProperty(14)
+    report15 = reportProperty(15)
+    report16 = reportProperty(16)
+    report17 = reportProperty(17)
+    report18 = reportProperty(18)
+    report19 = reportProperty(19)
+    report20 = reportProperty(20)
+
+    def __init__(self, runDirPath=None, check_mtime=False, **parse_options):
         self.name = None
-        self.report01: 'aem_report01' = aem_report01()
-        self.report02: 'aem_report02' = aem_report02()
-        self.report03: 'aem_report03' = aem_report03()
-        self.report04: 'aem_report04' = aem_report04()
-        self.report05: 'aem_report05' = aem_report05()
-        self.report06: 'aem_report06' = aem_report06()
-        self.report10: 'aem_report10' = aem_report10()
-        self.report11: 'aem_report11' = aem_report11()
-        self.report12: 'aem_report12' = aem_report12()
-        self.report13: 'aem_report13' = aem_report13()
-        self.report14: 'aem_report14' = aem_report14()
-        self.report15: 'aem_report15' = aem_report15()
-        self.report16: 'aem_report16' = aem_report16()
-        self.report17: 'aem_report17' = aem_report17()
-        self.report18: 'aem_report18' = aem_report18()
-        self.report19: 'aem_report19' = aem_report19()
-        self.report20: 'aem_report20' = aem_report20()
-
-    def parse_run(self, runDirPath):
-        reports = os.listdir(runDirPath)
+        self.check_mtime = check_mtime
+        self.parse_options = parse_options  # columnar, memory_map, chunk_workers, cache for lazily parsed reports
+        self.report_paths = {}  # report number -> report file, for reports parsed on first access
+        self._reports = {}
+        self._report_mtimes = {}
+        if runDirPath is not None:
+            self.find_reports(runDirPath)
+
+    def find_reports(self, runDirPath):
+        """Locate the report files in runDirPath (a Reports folder or run archive) without parsing them."""
+        for path in listReports(runDirPath):
+            number = reportNumber(path)
+            if number is not None:
+                self.report_paths[number] = path
+                self.invalidate(number)
+
+    def invalidate(self, number=None):
+        """Drop parsed reports (all of them if number is None) so they are parsed again on next access."""
+        numbers = list(self._reports) if number is None else [number]
+        for n in numbers:
+            if n in self.report_paths:
+                self._reports.pop(n, None)
+                self._report_mtimes.pop(n, None)
+
+    def load_report(self, number):
+        """Return aem_reportXX for number, parsing its report file if not done yet."""
+        path = self.report_paths.get(number)
+        if path is not None and number in self._reports and self.check_mtime:
+            mtime = self._report_mtimes[number]
+            if mtime is not None:
+                try:
+                    changed = reportStat(path)[1] != mtime
+                except (OSError, KeyError):
+                    changed = True
+                if changed:
+                    self.invalidate(number)
+        if number not in self._reports:
+            size, mtime = None, None
+            if path is not None:
+                try:
+                    size, mtime = reportStat(path)
+                except (OSError, KeyError):
+                    print(f'### AEM-PARSER v1.1.0:: {os.path.basename(path)} could not be read!')
+                    path = None
+            if path is None:
+                self._reports[number] = REPORT_SPECS[number].report_class()
+                self._report_mtimes[number] = None
+            else:
+                if size == 0:
+                    print(f'### AEM-PARSER v1.1.0:: {os.path.basename(path)} is empty!')
+                    report = REPORT_SPECS[number].report_class()
+                else:
+                    report = loadReportFile(path, number, **self.parse_options)
+                self._reports[number] = report
+                self._report_mtimes[number] = mtime
+        return self._reports[number]
+
+    def is_loaded(self, number):
+        """Whether reportXX for number has been parsed (or assigned) already."""
+        return number in self._reports
+
+    def parse_run(self, runDirPath, columnar=False, memory_map=None, chunk_workers=None, max_workers=None, cache=False):
+        """Parse every report in runDirPath (a Reports folder or run archive) into this run.
+
+        With max_workers > 1, the reports are parsed in parallel by that many processes, one report
+        per process (see parseReports); chunk_workers is then ignored. With cache, unchanged reports
+        are loaded from the parsed report cache and the others are saved to it (see loadReportFile).
+        """
+        reports = listReports(runDirPath)
+        options = dict(columnar=columnar, memory_map=memory_map, chunk_workers=chunk_workers, cache=cache)
+        if max_workers is not None and max_workers > 1:
+            parseReports(reports, self, max_workers=max_workers, **options)
+            return
         for report in reports:
-            parseReport(os.sep.join([runDirPath, report]), self)
+            parseReport(report, self, **options)
 
 ## aem_report CLASS
+CSV_WRITE_BUFFER = 1 << 20  # bytes buffered per CSV/JSON file before each write to disk
+CSV_CHUNK_ROWS = 1 << 14  # rows formatted at a time from columnar storage
+ARROW_ROW_GROUP_ROWS = 1 << 17  # rows per Parquet row group / Arrow record batch
+
+def importArrow():
+    """Import pyarrow, which only the Parquet and Arrow exports need."""
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError("Parquet/Arrow export requires pyarrow (pip install pyarrow)") from error
+    return pa, pq
+
 class aem_report:
     def __init__(self):
         self.path: str = ''
@@ -110,13 +227,172 @@ class aem_report:
         self.isEmpty = False
         self.target_solvent_comp = None
         self.target_salt_comp = None
+        self.columns: 'reportColumns' = None
+        self.columnar = False  # rows are held only in self.columns and item.data is empty
+
+    def iter_rows(self):
+        """Yield every row of the report as a dict, in file order."""
+        if self.columnar:
+            yield from self.columns.iter_rows()
+        else:
+            for item in self.items:
+                yield from item.data
+
+    def item_rows(self, item):
+        """Return the rows of one reportItem as a list of dicts."""
+        if self.columnar:
+            return list(self.columns.iter_rows(*item.row_range))
+        return item.data
+
+    def new_columns(self):
+        spec = REPORT_SPECS[self.number]
+        return reportColumns(spec.default_columns(self.version), spec.first)
+
+    def add_columnar_item(self, item):
+        """Move the rows of a parsed reportItem into the columnar storage and append the item."""
+        if self.columns is None:
+            self.columns = self.new_columns()
+        start = len(self.columns)
+        if item.table is not None:
+            self.columns.append_table(*item.table)
+            item.table = None
+        else:
+            self.columns.append(item.data)
+        item.row_range = (start, len(self.columns))
+        item.data = []
+        self.items.append(item)
+        self.columnar = True
+
+    def build_columns(self, drop_rows=False):
+        """Return the columnar storage of the report, building it from the parsed rows if needed.
+
+        With drop_rows, item.data is released once the rows are copied into the columns.
+        """
+        if self.columns is None:
+            self.columns = self.new_columns()
+            for item in self.items:
+                start = len(self.columns)
+                self.columns.append(item.data)
+                item.row_range = (start, len(self.columns))
+        if drop_rows and not self.columnar:
+            for item in self.items:
+                item.data = []
+            self.columnar = True
+        return self.columns
+
+    def to_numpy(self, columns=None):
+        """Return the rows as a 2-D float64 array (rows x columns), by default of all numeric table columns."""
+        cols = self.build_columns()
+        names = cols.numeric if columns is None else columns
+        if not names:
+            return np.empty((len(cols), 0))
+        return np.column_stack([cols.column(name).astype(np.float64, copy=False) for name in names])
+
+    def to_dataframe(self):
+        """Return the rows as a DataFrame with float64 table columns and categorical block-level columns."""
+        cols = self.build_columns()
+        return pd.DataFrame({name: cols.categorical_column(name) if name in cols.codes else cols.column(name) for name in cols.names})
+
+    def csv_columns(self):
+        """Column names of the CSV export, in order."""
+        return REPORT_SPECS[self.number].default_columns(self.version)
+
+    def iter_csv(self):
+        """Yield the CSV export line by line, header first, straight from the parsed rows or columns."""
+        columns = self.csv_columns()
+        yield f'{",".join(columns)}\n'
+        if self.columnar:
+            yield from self.columns.iter_csv(columns)
+            return
+        get = operator.itemgetter(*columns)
+        for d in self.iter_rows():
+            try:
+                values = get(d)
+            except KeyError:  # row of another layout
+                values = [d.get(var, "") for var in columns]
+            yield ','.join(map(str, values)) + '\n'
+
+    def all_csv(self):
+        return ''.join(self.iter_csv())
+
+    def save_all_csv(self, path):
+        with open(path, "w", buffering=CSV_WRITE_BUFFER) as f:
+            f.writelines(self.iter_csv())
+
+    def to_arrow(self):
+        """Return the rows as a pyarrow Table (requires pyarrow).
+
+        Table columns are float64 (NaN stays NaN), string block-level columns such as the compositions
+        are dictionary-encoded, and the other block-level columns are typed from their values.
+        """
+        pa = importArrow()[0]
+        cols = self.build_columns()
+        arrays = {}
+        for name in cols.names:
+            if name in cols.values:
+                arrays[name] = pa.array(cols.column(name), type=pa.float64())
+            elif all(isinstance(c, str) for c in cols.categories[name]):
+                codes = cols.column_codes(name)
+                arrays[name] = pa.DictionaryArray.from_arrays(pa.array(codes, mask=codes < 0),
+                                                              pa.array(cols.categories[name], type=pa.string()))
+            else:
+                arrays[name] = pa.array(cols.column(name).tolist())
+        return pa.table(arrays)
+
+    def save_all_parquet(self, path, row_group_size=ARROW_ROW_GROUP_ROWS):
+        """Write the rows to a Parquet file with per-row-group column statistics (requires pyarrow)."""
+        pq = importArrow()[1]
+        pq.write_table(self.to_arrow(), path, row_group_size=row_group_size, write_statistics=True)
+
+    def save_all_arrow(self, path, row_group_size=ARROW_ROW_GROUP_ROWS):
+        """Write the rows to an Arrow IPC file, readable with pyarrow.ipc.open_file or memory-mapped (requires pyarrow)."""
+        pa = importArrow()[0]
+        table = self.to_arrow()
+        with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=row_group_size)
+
+    def save_all_npy(self, folder, dtype=np.float64):
+        """Write each column to a .npy file in folder and return the report's schema entry (see save_memmap)."""
+        cols = self.build_columns()
+        files = reportColumnFiles(cols.names, folder, len(cols.codes), dtype)
+        for name in cols.numeric:
+            files.values[name].frombytes(memoryview(cols.values[name]).cast("B"))
+        for name in cols.codes:
+            files.codes[name].frombytes(memoryview(cols.codes[name]).cast("B"))
+        files.categories = cols.categories
+        files.length = len(cols)
+        return dict(number=self.number, version=self.version, source=os.path.basename(self.path),
+                    blocks=[item.row_range for item in self.items], **files.close())
+
+    def iter_json(self):
+        """Yield the JSON export (an indented array of rows) piece by piece, one row at a time.
+
+        The joined pieces are identical to json.dumps(list(self.iter_rows()), indent=4).
+        """
+        # Rows are flat, so the C encoder can lay out each one with the indentation as item separator
+        encode = json.JSONEncoder(separators=(',\n        ', ': ')).encode
+        separator = '[\n    '
+        for row in self.iter_rows():
+            yield separator + ('{\n        ' + encode(row)[1:-1] + '\n    }' if row else '{}')
+            separator = ',\n    '
+        yield '[]' if separator == '[\n    ' else '\n]'
 
     def all_json(self):
-        all_data = []
-        for item in self.items:
-            for i in item.data:
-                all_data.append(i)
-        return json.dumps(all_data, indent=4)
+        return ''.join(self.iter_json())
+
+    def save_all_json(self, path):
+        with open(path, "w", buffering=CSV_WRITE_BUFFER) as f:
+            f.writelines(self.iter_json())
+
+    def iter_ndjson(self):
+        """Yield the rows as newline-delimited JSON: one compact JSON object per line."""
+        encode = json.JSONEncoder(separators=(',', ':')).encode
+        for row in self.iter_rows():
+            yield encode(row) + '\n'
+
+    def save_all_ndjson(self, path):
+        with open(path, "w", buffering=CSV_WRITE_BUFFER) as f:
+            f.writelines(self.iter_ndjson())
 
 # Report Variables
 r01var_2242 = [
@@ -214,9 +490,11 @@ r20var = [
 ]
 
 ## Helper Functions
+PARSE_SENTINELS = ('********', '*****', '*DNC*')  # longest first, see tokenizeTable
+
 def parse_float(value):
     """Convert string to float, handling asterisks and invalid values as NaN."""
-    if not value or value in ('********', '*****', '*DNC*'):
+    if not value or value in PARSE_SENTINELS:
         return float('nan')
     try:
         return float(value)
@@ -241,425 +519,55 @@ def getReportVersionNumber(text):
 
 ## aem_reportXX CLASS (XX - Report No.)
 class aem_report01(aem_report):
-    def all_csv(self):
-        all_data = []
-        for item in self.items:
-            for i in item.data:
-                all_data.append(i)
-        if self.version == '2.24.2':
-            c = f'{",".join(r01var_2242)}\n'
-            for d in all_data:
-                c += f'{",".join(str(d.get(var, "")) for var in r01var_2242)}\n'
-        else:  # 2.24.3
-            c = f'{",".join(r01var)}\n'
-            for d in all_data:
-                c += f'{",".join(str(d.get(var, "")) for var in r01var)}\n'
-        return c
-
-    def save_all_csv(self, path):
-        if os.path.exists(path):
-            os.remove(path)
-        with open(path, "a") as f:
-            all_data = []
-            for item in self.items:
-                for i in item.data:
-                    all_data.append(i)
-            if self.version == '2.24.2':
-                f.write(f'{",".join(r01var_2242)}\n')
-                for d in all_data:
-                    f.write(f'{",".join(str(d.get(var, "")) for var in r01var_2242)}\n')
-            else:  # 2.24.3
-                f.write(f'{",".join(r01var)}\n')
-                for d in all_data:
-                    f.write(f'{",".join(str(d.get(var, "")) for var in r01var)}\n')
+    number = 1
 
 class aem_report02(aem_report):
-    def all_csv(self):
-        all_data = []
-        for item in self.items:
-            for i in item.data:
-                all_data.append(i)
-        c = f'{",".join(r02var)}\n'
-        for d in all_data:
-            c += f'{",".join(str(d.get(var, "")) for var in r02var)}\n'
-        return c
-
-    def save_all_csv(self, path):
-        if os.path.exists(path):
-            os.remove(path)
-        with open(path, "a") as f:
-            all_data = []
-            for item in self.items:
-                for i in item.data:
-                    all_data.append(i)
-            f.write(f'{",".join(r02var)}\n')
-            for d in all_data:
-                f.write(f'{",".join(str(d.get(var, "")) for var in r02var)}\n')
+    number = 2
 
 class aem_report03(aem_report):
-    def all_csv(self):
-        all_data = []
-        for item in self.items:
-            for i in item.data:
-                all_data.append(i)
-        c = f'{",".join(r03var)}\n'
-        for d in all_data:
-            c += f'{",".join(str(d.get(var, "")) for var in r03var)}\n'
-        return c
-
-    def save_all_csv(self, path):
-        if os.path.exists(path):
-            os.remove(path)
-        with open(path, "a") as f:
-            all_data = []
-            for item in self.items:
-                for i in item.data:
-                    all_data.append(i)
-            f.write(f'{",".join(r03var)}\n')
-            for d in all_data:
-                f.write(f'{",".join(str(d.get(var, "")) for var in r03var)}\n')
+    number = 3
 
 class aem_report04(aem_report):
-    def all_csv(self):
-        all_data = []
-        for item in self.items:
-            for i in item.data:
-                all_data.append(i)
-        c = f'{",".join(r04var)}\n'
-        for d in all_data:
-            c += f'{",".join(str(d.get(var, "")) for var in r04var)}\n'
-        return c
-
-    def save_all_csv(self, path):
-        if os.path.exists(path):
-            os.remove(path)
-        with open(path, "a") as f:
-            all_data = []
-            for item in self.items:
-                for i in item.data:
-                    all_data.append(i)
-            f.write(f'{",".join(r04var)}\n')
-            for d in all_data:
-                f.write(f'{",".join(str(d.get(var, "")) for var in r04var)}\n')
+    number = 4
 
 class aem_report05(aem_report):
-    def all_csv(self):
-        all_data = []
-        for item in self.items:
-            for i in item.data:
-                all_data.append(i)
-        if self.version == '2.24.2':
-            c = f'{",".join(r05var_2242)}\n'
-            for d in all_data:
-                c += f'{",".join(str(d.get(var, "")) for var in r05var_2242)}\n'
-        else:  # 2.24.3
-            c = f'{",".join(r05var)}\n'
-            for d in all_data:
-                c += f'{",".join(str(d.get(var, "")) for var in r05var)}\n'
-        return c
-
-    def save_all_csv(self, path):
-        if os.path.exists(path):
-            os.remove(path)
-        with open(path, "a") as f:
-            all_data = []
-            for item in self.items:
-                for i in item.data:
-                    all_data.append(i)
-            if self.version == '2.24.2':
-                f.write(f'{",".join(r05var_2242)}\n')
-                for d in all_data:
-                    f.write(f'{",".join(str(d.get(var, "")) for var in r05var_2242)}\n')
-            else:  # 2.24.3
-                f.write(f'{",".join(r05var)}\n')
-                for d in all_data:
-                    f.write(f'{",".join(str(d.get(var, "")) for var in r05var)}\n')
+    number = 5
 
 class aem_report06(aem_report):
-    def all_csv(self):
-        all_data = []
-        for item in self.items:
-            for i in item.data:
-                all_data.append(i)
-        c = f'{",".join(r06var)}\n'
-        for d in all_data:
-            c += f'{",".join(str(d.get(var, "")) for var in r06var)}\n'
-        return c
-
-    def save_all_csv(self, path):
-        if os.path.exists(path):
-            os.remove(path)
-        with open(path, "a") as f:
-            all_data = []
-            for item in self.items:
-                for i in item.data:
-                    all_data.append(i)
-            f.write(f'{",".join(r06var)}\n')
-            for d in all_data:
-                f.write(f'{",".join(str(d.get(var, "")) for var in r06var)}\n')
+    number = 6
 
 class aem_report10(aem_report):
-    def all_csv(self):
-        all_data = []
-        for item in self.items:
-            for i in item.data:
-                all_data.append(i)
-        c = f'{",".join(r10var)}\n'
-        for d in all_data:
-            c += f'{",".join(str(d.get(var, "")) for var in r10var)}\n'
-        return c
-
-    def save_all_csv(self, path):
-        if os.path.exists(path):
-            os.remove(path)
-        with open(path, "a") as f:
-            all_data = []
-            for item in self.items:
-                for i in item.data:
-                    all_data.append(i)
-            f.write(f'{",".join(r10var)}\n')
-            for d in all_data:
-                f.write(f'{",".join(str(d.get(var, "")) for var in r10var)}\n')
+    number = 10
 
 class aem_report11(aem_report):
-    def all_csv(self):
-        all_data = []
-        for item in self.items:
-            for i in item.data:
-                all_data.append(i)
-        c = f'{",".join(r11var)}\n'
-        for d in all_data:
-            c += f'{",".join(str(d.get(var, "")) for var in r11var)}\n'
-        return c
-
-    def save_all_csv(self, path):
-        if os.path.exists(path):
-            os.remove(path)
-        with open(path, "a") as f:
-            all_data = []
-            for item in self.items:
-                for i in item.data:
-                    all_data.append(i)
-            f.write(f'{",".join(r11var)}\n')
-            for d in all_data:
-                f.write(f'{",".join(str(d.get(var, "")) for var in r11var)}\n')
+    number = 11
 
 class aem_report12(aem_report):
-    def all_csv(self):
-        all_data = []
-        for item in self.items:
-            for i in item.data:
-                all_data.append(i)
-        if self.version == '2.24.2':
-            c = f'{",".join(r12var_2242)}\n'
-            for d in all_data:
-                c += f'{",".join(str(d.get(var, "")) for var in r12var_2242)}\n'
-        else:
-            c = f'{",".join(r12var)}\n'
-            for d in all_data:
-                c += f'{",".join(str(d.get(var, "")) for var in r12var)}\n'
-        return c
-
-    def save_all_csv(self, path):
-        if os.path.exists(path):
-            os.remove(path)
-        with open(path, "a") as f:
-            all_data = []
-            for item in self.items:
-                for i in item.data:
-                    all_data.append(i)
-            if self.version == '2.24.2':
-                f.write(f'{",".join(r12var_2242)}\n')
-                for d in all_data:
-                    f.write(f'{",".join(str(d.get(var, "")) for var in r12var_2242)}\n')
-            else:
-                f.write(f'{",".join(r12var)}\n')
-                for d in all_data:
-                    f.write(f'{",".join(str(d.get(var, "")) for var in r12var)}\n')
+    number = 12
 
 class aem_report13(aem_report):
-    def all_csv(self):
-        all_data = []
-        for item in self.items:
-            for i in item.data:
-                all_data.append(i)
-        c = f'{",".join(r13var)}\n'
-        for d in all_data:
-            c += f'{",".join(str(d.get(var, "")) for var in r13var)}\n'
-        return c
-
-    def save_all_csv(self, path):
-        if os.path.exists(path):
-            os.remove(path)
-        with open(path, "a") as f:
-            all_data = []
-            for item in self.items:
-                for i in item.data:
-                    all_data.append(i)
-            f.write(f'{",".join(r13var)}\n')
-            for d in all_data:
-                f.write(f'{",".join(str(d.get(var, "")) for var in r13var)}\n')
+    number = 13
 
 class aem_report14(aem_report):
-    def all_csv(self):
-        all_data = []
-        for item in self.items:
-            for i in item.data:
-                all_data.append(i)
-        c = f'{",".join(r14var)}\n'
-        for d in all_data:
-            c += f'{",".join(str(d.get(var, "")) for var in r14var)}\n'
-        return c
-
-    def save_all_csv(self, path):
-        if os.path.exists(path):
-            os.remove(path)
-        with open(path, "a") as f:
-            all_data = []
-            for item in self.items:
-                for i in item.data:
-                    all_data.append(i)
-            f.write(f'{",".join(r14var)}\n')
-            for d in all_data:
-                f.write(f'{",".join(str(d.get(var, "")) for var in r14var)}\n')
+    number = 14
 
 class aem_report15(aem_report):
-    def all_csv(self):
-        all_data = []
-        for item in self.items:
-            for i in item.data:
-                all_data.append(i)
-        c = f'{",".join(r15var)}\n'
-        for d in all_data:
-            c += f'{",".join(str(d.get(var, "")) for var in r15var)}\n'
-        return c
-
-    def save_all_csv(self, path):
-        if os.path.exists(path):
-            os.remove(path)
-        with open(path, "a") as f:
-            all_data = []
-            for item in self.items:
-                for i in item.data:
-                    all_data.append(i)
-            f.write(f'{",".join(r15var)}\n')
-            for d in all_data:
-                f.write(f'{",".join(str(d.get(var, "")) for var in r15var)}\n')
+    number = 15
 
 class aem_report16(aem_report):
-    def all_csv(self):
-        all_data = []
-        for item in self.items:
-            for i in item.data:
-                all_data.append(i)
-        c = f'{",".join(r16var)}\n'
-        for d in all_data:
-            c += f'{",".join(str(d.get(var, "")) for var in r16var)}\n'
-        return c
-
-    def save_all_csv(self, path):
-        if os.path.exists(path):
-            os.remove(path)
-        with open(path, "a") as f:
-            all_data = []
-            for item in self.items:
-                for i in item.data:
-                    all_data.append(i)
-            f.write(f'{",".join(r16var)}\n')
-            for d in all_data:
-                f.write(f'{",".join(str(d.get(var, "")) for var in r16var)}\n')
+    number = 16
 
 class aem_report17(aem_report):
-    def all_csv(self):
-        all_data = []
-        for item in self.items:
-            for i in item.data:
-                all_data.append(i)
-        c = f'{",".join(r17var)}\n'
-        for d in all_data:
-            c += f'{",".join(str(d.get(var, "")) for var in r17var)}\n'
-        return c
-
-    def save_all_csv(self, path):
-        if os.path.exists(path):
-            os.remove(path)
-        with open(path, "a") as f:
-            all_data = []
-            for item in self.items:
-                for i in item.data:
-                    all_data.append(i)
-            f.write(f'{",".join(r17var)}\n')
-            for d in all_data:
-                f.write(f'{",".join(str(d.get(var, "")) for var in r17var)}\n')
+    number = 17
 
 class aem_report18(aem_report):
-    def all_csv(self):
-        all_data = []
-        for item in self.items:
-            for i in item.data:
-                all_data.append(i)
-        c = f'{",".join(r18var)}\n'
-        for d in all_data:
-            c += f'{",".join(str(d.get(var, "")) for var in r18var)}\n'
-        return c
-
-    def save_all_csv(self, path):
-        if os.path.exists(path):
-            os.remove(path)
-        with open(path, "a") as f:
-            all_data = []
-            for item in self.items:
-                for i in item.data:
-                    all_data.append(i)
-            f.write(f'{",".join(r18var)}\n')
-            for d in all_data:
-                f.write(f'{",".join(str(d.get(var, "")) for var in r18var)}\n')
+    number = 18
 
 class aem_report19(aem_report):
-    def all_csv(self):
-        all_data = []
-        for item in self.items:
-            for i in item.data:
-                all_data.append(i)
-        c = f'{",".join(r19var)}\n'
-        for d in all_data:
-            c += f'{",".join(str(d.get(var, "")) for var in r19var)}\n'
-        return c
-
-    def save_all_csv(self, path):
-        if os.path.exists(path):
-            os.remove(path)
-        with open(path, "a") as f:
-            all_data = []
-            for item in self.items:
-                for i in item.data:
-                    all_data.append(i)
-            f.write(f'{",".join(r19var)}\n')
-            for d in all_data:
-                f.write(f'{",".join(str(d.get(var, "")) for var in r19var)}\n')
+    number = 19
 
 class aem_report20(aem_report):
-    def all_csv(self):
-        all_data = []
-        for item in self.items:
-            for i in item.data:
-                all_data.append(i)
-        c = f'{",".join(r20var)}\n'
-        for d in all_data:
-            c += f'{",".join(str(d.get(var, "")) for var in r20var)}\n'
-        return c
-
-    def save_all_csv(self, path):
-        if os.path.exists(path):
-            os.remove(path)
-        with open(path, "a") as f:
-            all_data = []
-            for item in self.items:
-                for i in item.data:
-                    all_data.append(i)
-            f.write(f'{",".join(r20var)}\n')
-            for d in all_data:
-                f.write(f'{",".join(str(d.get(var, "")) for var in r20var)}\n')
+    number = 20
 
 ## solventComp and saltComp CLASS
 class solventComp:
@@ -686,6 +594,8 @@ class reportItem:
         self.salts: List[saltComp] = []
         self.temperature: float = None
         self.data = []
+        self.row_range = None  # (start, stop) of this item's rows in the report columns
+        self.table = None  # (column names, float64 array, block-level values) before columnar storage
 
     def salts_str(self):
         return ','.join(str(s) for s in self.salts)
@@ -705,6 +615,118 @@ class reportItem:
     def json_data(self):
         return json.dumps(self.data, indent=4)
 
+## reportColumns CLASS
+NAN_CATEGORY = ('nan',)  # lookup key shared by NaN header values, which never compare equal
+
+def categoricalFromCodes(codes, categories):
+    """pd.Categorical of int32 codes into categories; a NaN category (pandas allows none) becomes a missing value."""
+    nan = [i for i, category in enumerate(categories) if category != category]
+    if not nan:
+        return pd.Categorical.from_codes(codes, categories=categories)
+    remap = np.arange(-1, len(categories), dtype=np.int32)  # code c -> remap[c + 1]
+    remap[nan[0] + 1] = -1
+    remap[nan[0] + 2:] -= 1
+    codes = remap[np.asarray(codes, dtype=np.int64) + 1]
+    return pd.Categorical.from_codes(codes, categories=[c for i, c in enumerate(categories) if i != nan[0]])
+
+class reportColumns:
+    """Columnar storage of report rows.
+
+    Table columns are kept as float64 arrays. Block-level columns (solvent_comp, salt_comp, temperature
+    and the Report10 header terms) repeat within a block, so they are stored as int32 codes into a
+    list of categories; code -1 stands for None.
+    """
+    def __init__(self, names, first=3):
+        self.names = list(names)
+        self.numeric = self.names[first:]
+        self.values = {name: array('d') for name in self.numeric}
+        self.codes = {name: array('i') for name in self.names[:first]}
+        self.categories = {name: [] for name in self.names[:first]}
+        self.lookup = {name: {} for name in self.names[:first]}
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def code(self, name, value):
+        if value is None:
+            return -1
+        lookup = self.lookup[name]
+        key = NAN_CATEGORY if value != value else value  # every NaN is one category, not a new one each time
+        code = lookup.get(key)
+        if code is None:
+            code = lookup[key] = len(self.categories[name])
+            self.categories[name].append(value)
+        return code
+
+    def append(self, rows):
+        """Append row dicts; table columns missing from a row are stored as NaN."""
+        nan = float('nan')
+        for row in rows:
+            for name, values in self.values.items():
+                values.append(row.get(name, nan))
+            for name, codes in self.codes.items():
+                codes.append(self.code(name, row.get(name)))
+        self.length += len(rows)
+
+    def append_table(self, names, table, header):
+        """Append a (rows x len(names)) float64 array of table columns sharing one set of block-level values."""
+        n = len(table)
+        index = {name: j for j, name in enumerate(names)}
+        for name, values in self.values.items():
+            if name in index:
+                values.frombytes(np.ascontiguousarray(table[:, index[name]], dtype=np.float64).tobytes())
+            else:
+                values.frombytes(np.full(n, np.nan).tobytes())
+        for name, codes in self.codes.items():
+            codes.frombytes(np.full(n, self.code(name, header.get(name)), dtype=np.int32).tobytes())
+        self.length += n
+
+    def column(self, name):
+        """Return a column as a NumPy array: float64 for table columns, decoded objects for block-level columns."""
+        if name in self.values:
+            return np.frombuffer(self.values[name], dtype=np.float64)
+        categories = np.array(self.categories[name] + [None], dtype=object)
+        return categories[self.column_codes(name)]
+
+    def column_codes(self, name):
+        return np.frombuffer(self.codes[name], dtype=np.int32)
+
+    def categorical_column(self, name):
+        return categoricalFromCodes(self.column_codes(name), self.categories[name])
+
+    def iter_rows(self, start=0, stop=None):
+        """Yield rows start..stop as dicts with the same keys and order as the parsed rows."""
+        stop = self.length if stop is None else stop
+        numeric = list(self.values.items())
+        categorical = [(name, codes, self.categories[name]) for name, codes in self.codes.items()]
+        for i in range(start, stop):
+            row = {name: values[i] for name, values in numeric}
+            for name, codes, categories in categorical:
+                c = codes[i]
+                row[name] = categories[c] if c >= 0 else None
+            yield row
+
+    def iter_csv(self, columns, chunk_rows=CSV_CHUNK_ROWS):
+        """Yield one CSV line per row with the given columns, formatting chunk_rows rows at a time.
+
+        Values are rendered as str() of the row dicts would render them ('None' for a missing
+        block-level value, an empty field for a column the storage does not have).
+        """
+        labels = {name: [str(c) for c in categories] + ['None'] for name, categories in self.categories.items()}
+        for start in range(0, self.length, chunk_rows):
+            stop = min(start + chunk_rows, self.length)
+            fields = []
+            for name in columns:
+                if name in self.values:
+                    fields.append(map(str, self.values[name][start:stop]))
+                elif name in self.codes:
+                    fields.append(map(labels[name].__getitem__, self.codes[name][start:stop]))  # code -1 -> 'None'
+                else:
+                    fields.append(itertools.repeat('', stop - start))
+            for row in zip(*fields):
+                yield ','.join(row) + '\n'
+
 ## aem_reportXXItem CLASS (XX - Report No.)
 class report01Item(reportItem):
     pass
@@ -770,44 +792,42 @@ class report20Item(reportItem):
     pass
 
 ## Parsing Functions
-def parseReport(report, run):
-    if os.path.getsize(report) == 0:
+def reportNumber(report):
+    """Return the report number a report file name stands for, or None for other files."""
+    for number in REPORT_SPECS:
+        if f"Report{number:02d} --" in report or (number < 10 and f"Report{number} --" in report):
+            return number
+    return None
+
+def parseReport(report, run, **options):
+    if reportSize(report) == 0:
         print(f'### AEM-PARSER v1.1.0:: {os.path.basename(report)} is empty!')
         return
-    if "Report01 --" in report or "Report1 --" in report:
-        run.report01 = parseReport01(report)
-    elif "Report02 --" in report or "Report2 --" in report:
-        run.report02 = parseReport02(report)
-    elif "Report03 --" in report or "Report3 --" in report:
-        run.report03 = parseReport03(report)
-    elif "Report04 --" in report or "Report4 --" in report:
-        run.report04 = parseReport04(report)
-    elif "Report05 --" in report or "Report5 --" in report:
-        run.report05 = parseReport05(report)
-    elif "Report06 --" in report or "Report6 --" in report:
-        run.report06 = parseReport06(report)
-    elif "Report10 --" in report:
-        run.report10 = parseReport10(report)
-    elif "Report11 --" in report:
-        run.report11 = parseReport11(report)
-    elif "Report12 --" in report:
-        run.report12 = parseReport12(report)
-    elif "Report13 --" in report:
-        run.report13 = parseReport13(report)
-    elif "Report14 --" in report:
-        run.report14 = parseReport14(report)
-    elif "Report15 --" in report:
-        run.report15 = parseReport15(report)
-    elif "Report16 --" in report:
-        run.report16 = parseReport16(report)
-    elif "Report17 --" in report:
-        run.report17 = parseReport17(report)
-    elif "Report18 --" in report:
-        run.report18 = parseReport18(report)
-    elif "Report19 --" in report:
-        run.report19 = parseReport19(report)
-    elif "Report20 --" in report:
-        run.report20 = parseReport20(report)
+    number = reportNumber(report)
+    if number is not None:
+        setattr(run, f'report{number:02d}', loadReportFile(report, number, **options))
+
+def parseReports(reports, run, max_workers=None, **options):
+    """Parse several report files into run, one report per worker process.
+
+    Reports are submitted largest first so the longest parse starts straight away; the wall time
+    then approaches that of the largest report. Each worker parses its report serially.
+    """
+    jobs = []
+    for report in reports:
+        size = reportSize(report)
+        if size == 0:
+            print(f'### AEM-PARSER v1.1.0:: {os.path.basename(report)} is empty!')
+            continue
+        number = reportNumber(report)
+        if number is not None:
+            jobs.append((size, report, number))
+    jobs.sort(reverse=True)
+    options.pop('chunk_workers', None)  # worker processes do not start pools of their own
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {number: executor.submit(loadReportFile, report, number, **options) for _, report, number in jobs}
+        for number, future in futures.items():
+            setattr(run, f'report{number:02d}', future.result())
 
 def parse_composition_temperature(pieces, r):
     """Parse composition and temperature, handling binary salts and solvents correctly."""
@@ -878,285 +898,362 @@ def getReportVersionNumber(text):
     elif (text.startswith('  AEM ver. 2.24.3M-D-ACCC')):
         return '2.24.3'
 
-def parseReport01(reportPath):
-    report01 = aem_report01()
-    report01.exists = True
-    report01.path = reportPath
-    report01.version = getReportVersionNumber(open(reportPath).read())
-    with open(reportPath) as f:
-        text = f.read()
-    contents = text.split('alt = ')
-    contents.pop(0)
-    
-    for content in contents:
-        first_item = None
-        data = []
-        r = report01Item()
-        r.version = report01.version
-        content = content.replace('==============================================================', '===============================')
-        pieces = content.split("===============================")
-        parse_composition_temperature(pieces, r)
-        if first_item is None:
-            first_item = r
-            report01.target_solvent_comp = r.solvents_str_no_comma()
-            report01.target_salt_comp = r.salts_str_no_comma()
-        if r.solvents_str_no_comma() == report01.target_solvent_comp and r.salts_str_no_comma() == report01.target_salt_comp:
-            try:
-                table_section = pieces[1].split('------------------------------------------------------------------------------------------------------------------------------------------------------------------------')[1]
-            except IndexError:
-                table_section = pieces[1]
-            foo = table_section.splitlines()
-            for fo in foo:
-                f = fo.replace("    ", " ").replace("   ", " ").replace("  ", " ")
-                d = f.strip().split()
-                if len(d) == 17 and report01.version == '2.24.2':
-                    j = {r01var_2242[i]: parse_float(d[i-3]) if i > 2 else d[i-3] for i in range(3, len(r01var_2242))}
-                    j.update({
-                        r01var_2242[0]: r.solvents_str_no_comma(),
-                        r01var_2242[1]: r.salts_str_no_comma(),
-                        r01var_2242[2]: r.temperature
-                    })
-                    data.append(j)
-                elif len(d) == 18:
-                    j = {r01var[i]: parse_float(d[i-3]) if i > 2 else d[i-3] for i in range(3, len(r01var))}
-                    j.update({
-                        r01var[0]: r.solvents_str_no_comma(),
-                        r01var[1]: r.salts_str_no_comma(),
-                        r01var[2]: r.temperature
-                    })
-                    data.append(j)
-            r.data = data
-            report01.items.append(r)
-    return report01
-
-def parseReport02(reportPath):
-    report02 = aem_report02()
-    report02.exists = True
-    report02.path = reportPath
-    report02.version = getReportVersionNumber(open(reportPath).read())
-    with open(reportPath) as f:
-        text = f.read()
-    contents = text.split('alt = ')
-    contents.pop(0)
-    
-    for content in contents:
-        first_item = None
-        data = []
-        r = report02Item()
-        r.version = report02.version
-        content = content.replace('==============================================================', '===============================')
-        pieces = content.split("===============================")
-        parse_composition_temperature(pieces, r)
-        if first_item is None:
-            first_item = r
-            report02.target_solvent_comp = r.solvents_str_no_comma()
-            report02.target_salt_comp = r.salts_str_no_comma()
-        if r.solvents_str_no_comma() == report02.target_solvent_comp and r.salts_str_no_comma() == report02.target_salt_comp:
-            try:
-                table_section = pieces[1].split('-----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------')[1]
-            except IndexError:
-                table_section = pieces[1]
-            foo = table_section.splitlines()
-            for fo in foo:
-                f = fo.replace("    ", " ").replace("   ", " ").replace("  ", " ")
-                d = f.strip().split()
-                if len(d) == 22:
-                    j = {r02var[i]: parse_float(d[i-3]) if i > 2 else d[i-3] for i in range(3, len(r02var))}
-                    j.update({
-                        r02var[0]: r.solvents_str_no_comma(),
-                        r02var[1]: r.salts_str_no_comma(),
-                        r02var[2]: r.temperature
-                    })
-                    data.append(j)
-            r.data = data
-            report02.items.append(r)
-    return report02
-
-def parseReport03(reportPath):
-    report03 = aem_report03()
-    report03.exists = True
-    report03.path = reportPath
-    report03.version = getReportVersionNumber(open(reportPath).read())
-    with open(reportPath) as f:
-        text = f.read()
-    contents = text.split('alt = ')
-    contents.pop(0)
-    
-    for content in contents:
-        first_item = None
-        data = []
-        r = report03Item()
-        r.version = report03.version
-        content = content.replace('==============================================================', '===============================')
-        pieces = content.split("===============================")
-        parse_composition_temperature(pieces, r)
-        if first_item is None:
-            first_item = r
-            report03.target_solvent_comp = r.solvents_str_no_comma()
-            report03.target_salt_comp = r.salts_str_no_comma()
-        if r.solvents_str_no_comma() == report03.target_solvent_comp and r.salts_str_no_comma() == report03.target_salt_comp:
-            try:
-                table_section = pieces[1].split('----------------------------------------------------------------------------------------------------------------------------------------')[1]
-            except IndexError:
-                for sep in ['----', '===', '\n\n']:
-                    if sep in pieces[1]:
-                        table_section = pieces[1].split(sep)[-1]
-                        break
-                else:
-                    print(f"### AEM-PARSER v1.1.0:: Failed to find table separator in {reportPath}")
-                    table_section = pieces[1]
-            foo = table_section.splitlines()
-            for fo in foo:
-                f = fo.replace("    ", " ").replace("   ", " ").replace("  ", " ").replace("*DNC*", "").replace('/', '')
-                d = f.strip().split()
-                if len(d) == 13:
-                    j = {r03var[i]: parse_float(d[i-3]) if i > 2 else d[i-3] for i in range(3, len(r03var))}
-                    j.update({
-                        r03var[0]: r.solvents_str_no_comma(),
-                        r03var[1]: r.salts_str_no_comma(),
-                        r03var[2]: r.temperature
-                    })
-                    data.append(j)
-            r.data = data
-            report03.items.append(r)
-    return report03
-
-def parseReport04(reportPath):
-    report04 = aem_report04()
-    report04.exists = True
-    report04.path = reportPath
-    report04.version = getReportVersionNumber(open(reportPath).read())
-    with open(reportPath) as f:
-        text = f.read()
-    contents = text.split('alt = ')
-    contents.pop(0)
-    
-    for content in contents:
-        first_item = None
-        data = []
-        r = report04Item()
-        r.version = report04.version
-        content = content.replace('==============================================================', '===============================')
-        pieces = content.split("===============================")
-        parse_composition_temperature(pieces, r)
-        if first_item is None:
-            first_item = r
-            report04.target_solvent_comp = r.solvents_str_no_comma()
-            report04.target_salt_comp = r.salts_str_no_comma()
-        if r.solvents_str_no_comma() == report04.target_solvent_comp and r.salts_str_no_comma() == report04.target_salt_comp:
-            try:
-                table_section = pieces[1].split('----------------------------------------------------------------------------------------------------------------------------------------------------------------')[1]
-            except IndexError:
-                table_section = pieces[1]
-            foo = table_section.splitlines()
-            for fo in foo:
-                f = fo.replace("    ", " ").replace("   ", " ").replace("  ", " ")
-                d = f.strip().split()
-                if len(d) == 15:
-                    j = {r04var[i]: parse_float(d[i-3]) if i > 2 else d[i-3] for i in range(3, len(r04var))}
-                    j.update({
-                        r04var[0]: r.solvents_str_no_comma(),
-                        r04var[1]: r.salts_str_no_comma(),
-                        r04var[2]: r.temperature
-                    })
-                    data.append(j)
-            r.data = data
-            report04.items.append(r)
-    return report04
-
-def parseReport05(reportPath):
-    report05 = aem_report05()
-    report05.exists = True
-    report05.path = reportPath
-    report05.version = getReportVersionNumber(open(reportPath).read())
-    with open(reportPath) as f:
-        text = f.read()
-    contents = text.split('alt = ')
-    contents.pop(0)
-    
-    for content in contents:
-        first_item = None
-        data = []
-        r = report05Item()
-        r.version = report05.version
-        content = content.replace('==============================================================', '===============================')
-        pieces = content.split("===============================")
-        parse_composition_temperature(pieces, r)
-        if first_item is None:
-            first_item = r
-            report05.target_solvent_comp = r.solvents_str_no_comma()
-            report05.target_salt_comp = r.salts_str_no_comma()
-        if r.solvents_str_no_comma() == report05.target_solvent_comp and r.salts_str_no_comma() == report05.target_salt_comp:
-            try:
-                table_section = pieces[1].split('--------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------')[1]
-            except IndexError:
-                table_section = pieces[1]
-            foo = table_section.splitlines()
-            for fo in foo:
-                f = fo.replace("    ", " ").replace("   ", " ").replace("  ", " ")
-                d = f.strip().split()
-                if len(d) == 17 and report05.version == '2.24.2':
-                    j = {r05var_2242[i]: parse_float(d[i-3]) if i > 2 else d[i-3] for i in range(3, len(r05var_2242))}
-                    j.update({
-                        r05var_2242[0]: r.solvents_str_no_comma(),
-                        r05var_2242[1]: r.salts_str_no_comma(),
-                        r05var_2242[2]: r.temperature
-                    })
-                    data.append(j)
-                elif len(d) == 18:
-                    j = {r05var[i]: parse_float(d[i-3]) if i > 2 else d[i-3] for i in range(3, len(r05var))}
-                    j.update({
-                        r05var[0]: r.solvents_str_no_comma(),
-                        r05var[1]: r.salts_str_no_comma(),
-                        r05var[2]: r.temperature
-                    })
-                    data.append(j)
-            r.data = data
-            report05.items.append(r)
-    return report05
-
-def parseReport06(reportPath):
-    report06 = aem_report06()
-    report06.exists = True
-    report06.path = reportPath
-    report06.version = getReportVersionNumber(open(reportPath).read())
+## Streaming Report Parser
+BLOCK_MARKER = 'alt = '  # every block starts with "Salt = <salts> at Temp. = <T> C"
+
+class reportSpec:
+    """Table layout of one report type: its classes, table separator and accepted row layouts."""
+    def __init__(self, number, report_class, item_class, separators, layouts, first=3, clean=None, fallback_separators=()):
+        self.number = number
+        self.report_class = report_class
+        self.item_class = item_class
+        self.separators = separators  # table separator width by version; None holds the default
+        self.layouts = layouts  # (column names, version) tried in order; version None accepts any version
+        self.first = first  # columns before this index come from the block header, the rest from the table
+        self.clean = clean
+        self.fallback_separators = fallback_separators
+
+    def table_separator(self, version):
+        return '-' * self.separators.get(version, self.separators[None])
+
+    def default_columns(self, version):
+        for columns, v in self.layouts:
+            if v is None or v == version:
+                return columns
+
+    def columns_for(self, count, version):
+        for columns, v in self.layouts:
+            if len(columns) - self.first == count and (v is None or v == version):
+                return columns
+        return None
+
+REPORT_SPECS = {
+    1: reportSpec(1, aem_report01, report01Item, {None: 168}, [(r01var_2242, '2.24.2'), (r01var, None)]),
+    2: reportSpec(2, aem_report02, report02Item, {None: 209}, [(r02var, None)]),
+    3: reportSpec(3, aem_report03, report03Item, {None: 136}, [(r03var, None)],
+                  clean=lambda line: line.replace("*DNC*", "").replace('/', ''), fallback_separators=('----', '===', '\n\n')),
+    4: reportSpec(4, aem_report04, report04Item, {None: 160}, [(r04var, None)]),
+    5: reportSpec(5, aem_report05, report05Item, {None: 182}, [(r05var_2242, '2.24.2'), (r05var, None)]),
+    6: reportSpec(6, aem_report06, report06Item, {None: 110}, [(r06var, None)]),
+    10: reportSpec(10, aem_report10, report10Item, {None: 108}, [(r10var, None)], first=14),
+    11: reportSpec(11, aem_report11, report11Item, {None: 139}, [(r11var, None)]),
+    12: reportSpec(12, aem_report12, report12Item, {'2.24.3': 157, None: 131}, [(r12var_2242, '2.24.2'), (r12var, None)]),
+    13: reportSpec(13, aem_report13, report13Item, {None: 142}, [(r13var, None)]),
+    14: reportSpec(14, aem_report14, report14Item, {None: 154}, [(r14var, None)]),
+    15: reportSpec(15, aem_report15, report15Item, {None: 191}, [(r15var, None)]),
+    16: reportSpec(16, aem_report16, report16Item, {None: 182}, [(r16var, None)]),
+    17: reportSpec(17, aem_report17, report17Item, {None: 161}, [(r17var, None)]),
+    18: reportSpec(18, aem_report18, report18Item, {None: 180}, [(r18var, None)]),
+    19: reportSpec(19, aem_report19, report19Item, {None: 180}, [(r19var, None)]),
+    20: reportSpec(20, aem_report20, report20Item, {None: 180}, [(r20var, None)])
+}
+
+def iterReportBlocks(lines):
+    """Yield the text following each 'alt = ' marker up to the next one, holding a single block in memory."""
+    block = None
+    for line in lines:
+        parts = line.split(BLOCK_MARKER)
+        if block is not None:
+            block.append(parts[0])
+        for part in parts[1:]:
+            if block is not None:
+                yield ''.join(block)
+            block = [part]
+    if block is not None:
+        yield ''.join(block)
+
+MEMORY_MAP_MIN_BYTES = 64 * 1024 ** 2  # reports at least this large are memory-mapped unless told otherwise
+REPORT_ENCODING = locale.getpreferredencoding(False)  # the encoding open() reads reports with
+
+def reportBlockOffsets(buf, start=0, end=None):
+    """Return the (start, end) byte offsets of the text following each 'alt = ' marker in a report buffer.
+
+    Works on bytes or an mmap without copying it; blocks end where the next marker begins.
+    """
+    marker = BLOCK_MARKER.encode('ascii')
+    end = len(buf) if end is None else end
+    starts = []
+    pos = buf.find(marker, start, end)
+    while pos != -1:
+        starts.append(pos)
+        pos = buf.find(marker, pos + len(marker), end)
+    return [(a + len(marker), b) for a, b in zip(starts, starts[1:] + [end])]
+
+def decodeReportText(data):
+    """Decode a slice of a report as open() would, including its universal newline translation."""
+    text = str(data, REPORT_ENCODING)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+def iterMappedReportBlocks(reportPath):
+    """Memory-map a report and yield its header line, then the text of each block.
+
+    Block boundaries are found by byte search over the mapping and only one block at a time is
+    decoded, so no copy of the file is made on the heap and the page cache serves repeated parses.
+    """
+    with open(reportPath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        newline = buf.find(b'\n')
+        yield decodeReportText(buf[:newline + 1 if newline != -1 else len(buf)])
+        view = memoryview(buf)
+        try:
+            for start, end in reportBlockOffsets(buf):
+                with view[start:end] as block:
+                    content = decodeReportText(block)
+                yield content
+        finally:
+            view.release()
+
+def readReportBlocks(reportPath, memory_map=None):
+    """Yield the header line of a report, then the text following each 'alt = ' marker.
+
+    Reports are read line by line, or memory-mapped if memory_map is True. By default reports of
+    MEMORY_MAP_MIN_BYTES or more are memory-mapped. Members of a run archive ('<archive>/<report>')
+    are read line by line as they are decompressed.
+    """
+    archive, name = splitArchivePath(reportPath)
+    if archive is not None:  # archive members are decompressed on the fly
+        with io.TextIOWrapper(openArchiveMember(archive, name), encoding=REPORT_ENCODING) as f:
+            header = f.readline()
+            yield header
+            yield from iterReportBlocks(itertools.chain([header], f))
+        return
+    size = os.path.getsize(reportPath)
+    if memory_map is None:
+        memory_map = size >= MEMORY_MAP_MIN_BYTES
+    if memory_map and size > 0:  # empty files cannot be mapped
+        yield from iterMappedReportBlocks(reportPath)
+        return
     with open(reportPath) as f:
-        text = f.read()
-    contents = text.split('alt = ')
-    contents.pop(0)
-    
-    for content in contents:
-        first_item = None
-        data = []
-        r = report06Item()
-        r.version = report06.version
-        content = content.replace('==============================================================', '===============================')
-        pieces = content.split("===============================")
-        parse_composition_temperature(pieces, r)
-        if first_item is None:
-            first_item = r
-            report06.target_solvent_comp = r.solvents_str_no_comma()
-            report06.target_salt_comp = r.salts_str_no_comma()
-        if r.solvents_str_no_comma() == report06.target_solvent_comp and r.salts_str_no_comma() == report06.target_salt_comp:
-            try:
-                table_section = pieces[1].split('--------------------------------------------------------------------------------------------------------------')[1]
-            except IndexError:
-                table_section = pieces[1]
-            foo = table_section.splitlines()
-            for fo in foo:
-                f = fo.replace("    ", " ").replace("   ", " ").replace("  ", " ")
-                d = f.strip().split()
-                if len(d) == 11:
-                    j = {r06var[i]: parse_float(d[i-3]) if i > 2 else d[i-3] for i in range(3, len(r06var))}
-                    j.update({
-                        r06var[0]: r.solvents_str_no_comma(),
-                        r06var[1]: r.salts_str_no_comma(),
-                        r06var[2]: r.temperature
-                    })
-                    data.append(j)
-            r.data = data
-            report06.items.append(r)
-    return report06
+        header = f.readline()
+        yield header
+        yield from iterReportBlocks(itertools.chain([header], f))
+
+def findTableSection(spec, body, version, reportPath):
+    """Return the part of a block body below its table separator."""
+    try:
+        return body.split(spec.table_separator(version))[1]
+    except IndexError:
+        pass
+    if spec.fallback_separators:
+        for sep in spec.fallback_separators:
+            if sep in body:
+                return body.split(sep)[-1]
+        print(f"### AEM-PARSER v1.1.0:: Failed to find table separator in {reportPath}")
+    return body
+
+def blockHeader(r, columns, first):
+    """Return the block-level columns of a row: compositions, temperature and the Report10 header terms."""
+    header = {columns[0]: r.solvents_str_no_comma(), columns[1]: r.salts_str_no_comma(), columns[2]: r.temperature}
+    for var in columns[3:first]:
+        header[var] = getattr(r, var)
+    return header
+
+def tokenizeTable(lines, count):
+    """Convert table lines that each hold `count` values into a (rows x count) float64 array in one pass.
+
+    Sentinels become NaN. If any other value is not a number the block is converted cell by cell
+    with parse_float, so the result always matches the row-by-row parser.
+    """
+    if not lines:
+        return np.empty((0, count))
+    text = '\n'.join(lines)
+    for sentinel in PARSE_SENTINELS:
+        text = text.replace(sentinel, 'nan')
+    try:
+        return np.loadtxt(io.StringIO(text), dtype=np.float64, comments=None, ndmin=2)
+    except ValueError:
+        return np.array([[parse_float(v) for v in line.split()] for line in lines], dtype=np.float64).reshape(len(lines), count)
+
+def parseTableRows(spec, lines, version, header):
+    """Row-by-row parser, used when one block mixes several row layouts."""
+    first = spec.first
+    data = []
+    for line in lines:
+        d = line.split()
+        columns = spec.columns_for(len(d), version)
+        if columns is None:
+            continue
+        j = {columns[i]: parse_float(d[i - first]) for i in range(first, len(columns))}
+        j.update(header(columns))
+        data.append(j)
+    return data
+
+def parseReportBlock(spec, content, version, reportPath, as_table=False):
+    """Parse the text of one 'alt = ' block into a reportItem holding its rows.
+
+    Table lines are counted in one vectorized pass and those matching a report layout are converted
+    to floats in bulk. With as_table, the rows are left as (columns, array, header) in item.table
+    instead of being expanded into dicts in item.data.
+    """
+    r = spec.item_class()
+    r.version = version
+    content = content.replace('==============================================================', '===============================')
+    pieces = content.split("===============================")
+    parse_composition_temperature(pieces, r)
+    if spec.number == 10:
+        parse_report_10_specific_variables(pieces, r)
+    header = lambda columns: blockHeader(r, columns, spec.first)
+    section = findTableSection(spec, pieces[1], version, reportPath)
+    if spec.clean is not None:
+        section = spec.clean(section)
+    lines = section.splitlines()
+    counts = np.fromiter(map(len, map(str.split, lines)), dtype=np.intp, count=len(lines))
+    layouts = [(count, spec.columns_for(count, version)) for count in np.unique(counts).tolist()]
+    layouts = [(count, columns) for count, columns in layouts if columns is not None]
+    if len(layouts) > 1:
+        r.data = parseTableRows(spec, lines, version, header)
+        return r
+    count, columns = layouts[0] if layouts else (0, spec.default_columns(version))
+    table = tokenizeTable([lines[i] for i in np.flatnonzero(counts == count).tolist()] if layouts else [], count)
+    if as_table:
+        r.table = (columns[spec.first:], table, header(columns))
+        return r
+    names = columns[spec.first:]
+    block = header(columns)
+    r.data = [dict(zip(names, values), **block) for values in table.tolist()]
+    return r
+
+def iterReportItems(reportPath, number, report=None, as_table=False, memory_map=None):
+    """Stream a report file, yielding one reportItem (with its rows in .data) per block.
+
+    The file is read once, line by line or through a memory map (see readReportBlocks), and only the
+    current block is held in memory. If `report` is given, its path, version and target compositions
+    are filled in as the file is read.
+    """
+    spec = REPORT_SPECS[number]
+    blocks = readReportBlocks(reportPath, memory_map)
+    try:
+        version = getReportVersionNumber(next(blocks))
+        if report is not None:
+            report.exists = True
+            report.path = reportPath
+            report.version = version
+        for content in blocks:
+            r = parseReportBlock(spec, content, version, reportPath, as_table)
+            if report is not None:
+                report.target_solvent_comp = r.solvents_str_no_comma()
+                report.target_salt_comp = r.salts_str_no_comma()
+            yield r
+    finally:
+        blocks.close()
+
+## Chunk-parallel Parsing
+CHUNKS_PER_WORKER = 4  # several chunks per worker keep the pool busy when blocks differ in size
+
+def chunkBlockOffsets(offsets, chunks):
+    """Split block offsets into at most `chunks` contiguous runs of roughly equal byte size."""
+    if not offsets:
+        return []
+    target = (offsets[-1][1] - offsets[0][0]) / chunks
+    runs = []
+    run = []
+    size = 0
+    for start, end in offsets:
+        run.append((start, end))
+        size += end - start
+        if size >= target and len(runs) < chunks - 1:
+            runs.append(run)
+            run = []
+            size = 0
+    if run:
+        runs.append(run)
+    return runs
+
+def _parse_block_range(reportPath, number, version, offsets, as_table):
+    """Worker: memory-map a report and parse the blocks at the given byte offsets."""
+    spec = REPORT_SPECS[number]
+    items = []
+    with open(reportPath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        view = memoryview(buf)
+        try:
+            for start, end in offsets:
+                with view[start:end] as block:
+                    content = decodeReportText(block)
+                items.append(parseReportBlock(spec, content, version, reportPath, as_table))
+        finally:
+            view.release()
+    return items
+
+def iterReportItemsChunked(reportPath, number, report=None, as_table=False, max_workers=None):
+    """Parse the blocks of one report in parallel and yield their reportItems in file order.
+
+    Block byte offsets are found up front over a memory map, then contiguous runs of blocks are
+    parsed by a pool of worker processes; each worker maps the file itself.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    offsets = []
+    with open(reportPath, 'rb') as f:
+        header = f.readline()
+        if header:  # empty files cannot be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                offsets = reportBlockOffsets(buf)
+    version = getReportVersionNumber(decodeReportText(header))
+    if report is not None:
+        report.exists = True
+        report.path = reportPath
+        report.version = version
+    runs = chunkBlockOffsets(offsets, max_workers * CHUNKS_PER_WORKER)
+    executor = None
+    futures = []
+    if len(runs) < 2:
+        results = (_parse_block_range(reportPath, number, version, run, as_table) for run in runs)
+    else:
+        executor = ProcessPoolExecutor(max_workers=min(max_workers, len(runs)))
+        futures = [executor.submit(_parse_block_range, reportPath, number, version, run, as_table) for run in runs]
+        results = (future.result() for future in futures)
+    try:
+        for items in results:
+            for r in items:
+                if report is not None:
+                    report.target_solvent_comp = r.solvents_str_no_comma()
+                    report.target_salt_comp = r.salts_str_no_comma()
+                yield r
+    finally:
+        if executor is not None:
+            for future in futures:
+                future.cancel()  # no-op for chunks already parsed
+            executor.shutdown()
+
+def parseReportFile(reportPath, number, columnar=False, memory_map=None, chunk_workers=None):
+    """Parse a whole report file into its aem_reportXX object.
+
+    With columnar, rows are stored block by block in report.columns instead of as dicts in item.data.
+    memory_map selects how the file is read, see readReportBlocks. With chunk_workers > 1, the
+    blocks are parsed in parallel by that many processes (see iterReportItemsChunked); archive
+    members are always parsed serially.
+    """
+    report = REPORT_SPECS[number].report_class()
+    if chunk_workers is not None and chunk_workers > 1 and splitArchivePath(reportPath)[0] is None:
+        items = iterReportItemsChunked(reportPath, number, report, as_table=columnar, max_workers=chunk_workers)
+    else:
+        items = iterReportItems(reportPath, number, report, as_table=columnar, memory_map=memory_map)
+    for r in items:
+        if columnar:
+            report.add_columnar_item(r)
+        else:
+            report.items.append(r)
+    if columnar:
+        report.build_columns(drop_rows=True)
+    return report
+
+def parseReport01(reportPath, **options):
+    return parseReportFile(reportPath, 1, **options)
+
+def parseReport02(reportPath, **options):
+    return parseReportFile(reportPath, 2, **options)
+
+def parseReport03(reportPath, **options):
+    return parseReportFile(reportPath, 3, **options)
+
+def parseReport04(reportPath, **options):
+    return parseReportFile(reportPath, 4, **options)
+
+def parseReport05(reportPath, **options):
+    return parseReportFile(reportPath, 5, **options)
+
+def parseReport06(reportPath, **options):
+    return parseReportFile(reportPath, 6, **options)
 
 def parse_report_10_specific_variables(pieces, r: report10Item):
     try:
@@ -1176,712 +1273,606 @@ def parse_report_10_specific_variables(pieces, r: report10Item):
     except IndexError:
         print(f"### AEM-PARSER v1.1.0:: Warning: Incomplete Report10 specific variables parsing")
 
-def parseReport10(reportPath):
-    report10 = aem_report10()
-    report10.exists = True
-    report10.path = reportPath
-    report10.version = getReportVersionNumber(open(reportPath).read())
-    with open(reportPath) as f:
-        text = f.read()
-    contents = text.split('alt = ')
-    contents.pop(0)
-    
-    for content in contents:
-        first_item = None
-        data = []
-        r = report10Item()
-        r.version = report10.version
-        content = content.replace('==============================================================', '===============================')
-        pieces = content.split("===============================")
-        parse_composition_temperature(pieces, r)
-        if first_item is None:
-            first_item = r
-            report10.target_solvent_comp = r.solvents_str_no_comma()
-            report10.target_salt_comp = r.salts_str_no_comma()
-        if r.solvents_str_no_comma() == report10.target_solvent_comp and r.salts_str_no_comma() == report10.target_salt_comp:
-            parse_report_10_specific_variables(pieces, r)
-            try:
-                table_section = pieces[1].split('------------------------------------------------------------------------------------------------------------')[1]
-            except IndexError:
-                table_section = pieces[1]
-            foo = table_section.splitlines()
-            for fo in foo:
-                f = fo.replace("    ", " ").replace("   ", " ").replace("  ", " ")
-                d = f.strip().split()
-                if len(d) == 7:
-                    j = {r10var[i]: parse_float(d[i-14]) if i > 13 else d[i-14] for i in range(14, len(r10var))}
-                    j.update({
-                        r10var[0]: r.solvents_str_no_comma(),
-                        r10var[1]: r.salts_str_no_comma(),
-                        r10var[2]: r.temperature,
-                        r10var[3]: r.surface_charge_density,
-                        r10var[4]: r.cell_voltage_at_start_of_pulse,
-                        r10var[5]: r.salt_concentration_basis,
-                        r10var[6]: r.pulse_type,
-                        r10var[7]: r.electrolyte_rel_perm_at_salt_conc,
-                        r10var[8]: r.dipole_moment_data,
-                        r10var[9]: r.solvent_diameter,
-                        r10var[10]: r.equivalent_charge_on_solvent_dipole,
-                        r10var[11]: r.sei_thickness,
-                        r10var[12]: r.sei_porosity,
-                        r10var[13]: r.sei_relative_permittivity
-                    })
-                    data.append(j)
-            r.data = data
-            report10.items.append(r)
-    return report10
-
-def parseReport11(reportPath):
-    report11 = aem_report11()
-    report11.exists = True
-    report11.path = reportPath
-    report11.version = getReportVersionNumber(open(reportPath).read())
-    with open(reportPath) as f:
-        text = f.read()
-    contents = text.split('alt = ')
-    contents.pop(0)
-    
-    for content in contents:
-        first_item = None
-        data = []
-        r = report11Item()
-        r.version = report11.version
-        content = content.replace('==============================================================', '===============================')
-        pieces = content.split("===============================")
-        parse_composition_temperature(pieces, r)
-        if first_item is None:
-            first_item = r
-            report11.target_solvent_comp = r.solvents_str_no_comma()
-            report11.target_salt_comp = r.salts_str_no_comma()
-        if r.solvents_str_no_comma() == report11.target_solvent_comp and r.salts_str_no_comma() == report11.target_salt_comp:
-            try:
-                table_section = pieces[1].split('-------------------------------------------------------------------------------------------------------------------------------------------')[1]
-            except IndexError:
-                table_section = pieces[1]
-            foo = table_section.splitlines()
-            for fo in foo:
-                f = fo.replace("    ", " ").replace("   ", " ").replace("  ", " ")
-                d = f.strip().split()
-                if len(d) == 13:
-                    j = {r11var[i]: parse_float(d[i-3]) if i > 2 else d[i-3] for i in range(3, len(r11var))}
-                    j.update({
-                        r11var[0]: r.solvents_str_no_comma(),
-                        r11var[1]: r.salts_str_no_comma(),
-                        r11var[2]: r.temperature
-                    })
-                    data.append(j)
-            r.data = data
-            report11.items.append(r)
-    return report11
-
-def parseReport12(reportPath):
-    report12 = aem_report12()
-    report12.exists = True
-    report12.path = reportPath
-    report12.version = getReportVersionNumber(open(reportPath).read())
-    with open(reportPath) as f:
-        text = f.read()
-    contents = text.split('alt = ')
-    contents.pop(0)
-    
-    for content in contents:
-        first_item = None
-        data = []
-        r = report12Item()
-        r.version = report12.version
-        content = content.replace('==============================================================', '===============================')
-        pieces = content.split("===============================")
-        parse_composition_temperature(pieces, r)
-        if first_item is None:
-            first_item = r
-            report12.target_solvent_comp = r.solvents_str_no_comma()
-            report12.target_salt_comp = r.salts_str_no_comma()
-        if r.solvents_str_no_comma() == report12.target_solvent_comp and r.salts_str_no_comma() == report12.target_salt_comp:
-            try:
-                table_section = pieces[1].split('-------------------------------------------------------------------------------------------------------------------------------------------------------------' if report12.version == '2.24.3' else '-----------------------------------------------------------------------------------------------------------------------------------')[1]
-            except IndexError:
-                table_section = pieces[1]
-            foo = table_section.splitlines()
-            for fo in foo:
-                f = fo.replace("           ", " ").replace("    ", " ").replace("   ", " ").replace("  ", " ")
-                d = f.strip().split()
-                if len(d) == 12 and report12.version == '2.24.2':
-                    j = {r12var_2242[i]: parse_float(d[i-3]) if i > 2 else d[i-3] for i in range(3, len(r12var_2242))}
-                    j.update({
-                        r12var_2242[0]: r.solvents_str_no_comma(),
-                        r12var_2242[1]: r.salts_str_no_comma(),
-                        r12var_2242[2]: r.temperature
-                    })
-                    data.append(j)
-                elif len(d) == 22:
-                    j = {r12var[i]: parse_float(d[i-3]) if i > 2 else d[i-3] for i in range(3, len(r12var))}
-                    j.update({
-                        r12var[0]: r.solvents_str_no_comma(),
-                        r12var[1]: r.salts_str_no_comma(),
-                        r12var[2]: r.temperature
-                    })
-                    data.append(j)
-            r.data = data
-            report12.items.append(r)
-    return report12
-
-def parseReport13(reportPath):
-    report13 = aem_report13()
-    report13.exists = True
-    report13.path = reportPath
-    report13.version = getReportVersionNumber(open(reportPath).read())
-    with open(reportPath) as f:
-        text = f.read()
-    contents = text.split('alt = ')
-    contents.pop(0)
-    
-    for content in contents:
-        first_item = None
-        data = []
-        r = report13Item()
-        r.version = report13.version
-        content = content.replace('==============================================================', '===============================')
-        pieces = content.split("===============================")
-        parse_composition_temperature(pieces, r)
-        if first_item is None:
-            first_item = r
-            report13.target_solvent_comp = r.solvents_str_no_comma()
-            report13.target_salt_comp = r.salts_str_no_comma()
-        if r.solvents_str_no_comma() == report13.target_solvent_comp and r.salts_str_no_comma() == report13.target_salt_comp:
-            try:
-                table_section = pieces[1].split('----------------------------------------------------------------------------------------------------------------------------------------------')[1]
-            except IndexError:
-                table_section = pieces[1]
-            foo = table_section.splitlines()
-            for fo in foo:
-                f = fo.replace("           ", " ").replace("    ", " ").replace("   ", " ").replace("  ", " ")
-                d = f.strip().split()
-                if len(d) == 16:
-                    j = {r13var[i]: parse_float(d[i-3]) if i > 2 else d[i-3] for i in range(3, len(r13var))}
-                    j.update({
-                        r13var[0]: r.solvents_str_no_comma(),
-                        r13var[1]: r.salts_str_no_comma(),
-                        r13var[2]: r.temperature
-                    })
-                    data.append(j)
-            r.data = data
-            report13.items.append(r)
-    return report13
-
-def parseReport14(reportPath):
-    report14 = aem_report14()
-    report14.exists = True
-    report14.path = reportPath
-    report14.version = getReportVersionNumber(open(reportPath).read())
-    with open(reportPath) as f:
-        text = f.read()
-    contents = text.split('alt = ')
-    contents.pop(0)
-    
-    for content in contents:
-        first_item = None
-        data = []
-        r = report14Item()
-        r.version = report14.version
-        content = content.replace('==============================================================', '===============================')
-        pieces = content.split("===============================")
-        parse_composition_temperature(pieces, r)
-        if first_item is None:
-            first_item = r
-            report14.target_solvent_comp = r.solvents_str_no_comma()
-            report14.target_salt_comp = r.salts_str_no_comma()
-        if r.solvents_str_no_comma() == report14.target_solvent_comp and r.salts_str_no_comma() == report14.target_salt_comp:
-            try:
-                table_section = pieces[1].split('----------------------------------------------------------------------------------------------------------------------------------------------------------')[1]
-            except IndexError:
-                table_section = pieces[1]
-            foo = table_section.splitlines()
-            for fo in foo:
-                f = fo.replace("           ", " ").replace("    ", " ").replace("   ", " ").replace("  ", " ")
-                d = f.strip().split()
-                if len(d) == 4:
-                    j = {r14var[i]: parse_float(d[i-3]) if i > 2 else d[i-3] for i in range(3, len(r14var))}
-                    j.update({
-                        r14var[0]: r.solvents_str_no_comma(),
-                        r14var[1]: r.salts_str_no_comma(),
-                        r14var[2]: r.temperature
-                    })
-                    data.append(j)
-            r.data = data
-            report14.items.append(r)
-    return report14
-
-def parseReport15(reportPath):
-    report15 = aem_report15()
-    report15.exists = True
-    report15.path = reportPath
-    report15.version = getReportVersionNumber(open(reportPath).read())
-    with open(reportPath) as f:
-        text = f.read()
-    contents = text.split('alt = ')
-    contents.pop(0)
-    
-    for content in contents:
-        first_item = None
-        data = []
-        r = report15Item()
-        r.version = report15.version
-        content = content.replace('==============================================================', '===============================')
-        pieces = content.split("===============================")
-        parse_composition_temperature(pieces, r)
-        if first_item is None:
-            first_item = r
-            report15.target_solvent_comp = r.solvents_str_no_comma()
-            report15.target_salt_comp = r.salts_str_no_comma()
-        if r.solvents_str_no_comma() == report15.target_solvent_comp and r.salts_str_no_comma() == report15.target_salt_comp:
-            try:
-                table_section = pieces[1].split('-----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------')[1]
-            except IndexError:
-                table_section = pieces[1]
-            foo = table_section.splitlines()
-            for fo in foo:
-                f = fo.replace("           ", " ").replace("    ", " ").replace("   ", " ").replace("  ", " ")
-                d = f.strip().split()
-                if len(d) == 16:
-                    j = {r15var[i]: parse_float(d[i-3]) if i > 2 else d[i-3] for i in range(3, len(r15var))}
-                    j.update({
-                        r15var[0]: r.solvents_str_no_comma(),
-                        r15var[1]: r.salts_str_no_comma(),
-                        r15var[2]: r.temperature
-                    })
-                    data.append(j)
-            r.data = data
-            report15.items.append(r)
-    return report15
-
-def parseReport16(reportPath):
-    report16 = aem_report16()
-    report16.exists = True
-    report16.path = reportPath
-    report16.version = getReportVersionNumber(open(reportPath).read())
-    with open(reportPath) as f:
-        text = f.read()
-    contents = text.split('alt = ')
-    contents.pop(0)
-    
-    for content in contents:
-        first_item = None
-        data = []
-        r = report16Item()
-        r.version = report16.version
-        content = content.replace('==============================================================', '===============================')
-        pieces = content.split("===============================")
-        parse_composition_temperature(pieces, r)
-        if first_item is None:
-            first_item = r
-            report16.target_solvent_comp = r.solvents_str_no_comma()
-            report16.target_salt_comp = r.salts_str_no_comma()
-        if r.solvents_str_no_comma() == report16.target_solvent_comp and r.salts_str_no_comma() == report16.target_salt_comp:
-            try:
-                table_section = pieces[1].split('--------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------')[1]
-            except IndexError:
-                table_section = pieces[1]
-            foo = table_section.splitlines()
-            for fo in foo:
-                f = fo.replace('          ', ' ').replace("    ", " ").replace("   ", " ").replace("  ", " ")
-                d = f.strip().split()
-                if len(d) == 14:
-                    j = {r16var[i]: parse_float(d[i-3]) if i > 2 else d[i-3] for i in range(3, len(r16var))}
-                    j.update({
-                        r16var[0]: r.solvents_str_no_comma(),
-                        r16var[1]: r.salts_str_no_comma(),
-                        r16var[2]: r.temperature
-                    })
-                    data.append(j)
-            r.data = data
-            report16.items.append(r)
-    return report16
-
-def parseReport17(reportPath):
-    report17 = aem_report17()
-    report17.exists = True
-    report17.path = reportPath
-    report17.version = getReportVersionNumber(open(reportPath).read())
-    with open(reportPath) as f:
-        text = f.read()
-    contents = text.split('alt = ')
-    contents.pop(0)
-    
-    for content in contents:
-        first_item = None
-        data = []
-        r = report17Item()
-        r.version = report17.version
-        content = content.replace('==============================================================', '===============================')
-        pieces = content.split("===============================")
-        parse_composition_temperature(pieces, r)
-        if first_item is None:
-            first_item = r
-            report17.target_solvent_comp = r.solvents_str_no_comma()
-            report17.target_salt_comp = r.salts_str_no_comma()
-        if r.solvents_str_no_comma() == report17.target_solvent_comp and r.salts_str_no_comma() == report17.target_salt_comp:
-            try:
-                table_section = pieces[1].split('-----------------------------------------------------------------------------------------------------------------------------------------------------------------')[1]
-            except IndexError:
-                table_section = pieces[1]
-            foo = table_section.splitlines()
-            for fo in foo:
-                f = fo.replace('            ', ' ').replace('         ', ' ').replace('        ', ' ').replace('       ', ' ').replace('      ', ' ').replace('     ', ' ').replace('    ', ' ').replace('   ', ' ').replace('  ', ' ')
-                d = f.strip().split()
-                if len(d) == 11:
-                    j = {r17var[i]: parse_float(d[i-3]) if i > 2 else d[i-3] for i in range(3, len(r17var))}
-                    j.update({
-                        r17var[0]: r.solvents_str_no_comma(),
-                        r17var[1]: r.salts_str_no_comma(),
-                        r17var[2]: r.temperature
-                    })
-                    data.append(j)
-            r.data = data
-            report17.items.append(r)
-    return report17
-
-def parseReport18(reportPath):
-    report18 = aem_report18()
-    report18.exists = True
-    report18.path = reportPath
-    report18.version = getReportVersionNumber(open(reportPath).read())
-    with open(reportPath) as f:
-        text = f.read()
-    contents = text.split('alt = ')
-    contents.pop(0)
-    
-    for content in contents:
-        first_item = None
-        data = []
-        r = report18Item()
-        r.version = report18.version
-        content = content.replace('==============================================================', '===============================')
-        pieces = content.split("===============================")
-        parse_composition_temperature(pieces, r)
-        if first_item is None:
-            first_item = r
-            report18.target_solvent_comp = r.solvents_str_no_comma()
-            report18.target_salt_comp = r.salts_str_no_comma()
-        if r.solvents_str_no_comma() == report18.target_solvent_comp and r.salts_str_no_comma() == report18.target_salt_comp:
-            try:
-                table_section = pieces[1].split('------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------')[1]
-            except IndexError:
-                table_section = pieces[1]
-            foo = table_section.splitlines()
-            for fo in foo:
-                f = fo.replace("    ", " ").replace("   ", " ").replace("  ", " ")
-                d = f.strip().split()
-                if len(d) == 17:
-                    j = {r18var[i]: parse_float(d[i-3]) if i > 2 else d[i-3] for i in range(3, len(r18var))}
-                    j.update({
-                        r18var[0]: r.solvents_str_no_comma(),
-                        r18var[1]: r.salts_str_no_comma(),
-                        r18var[2]: r.temperature
-                    })
-                    data.append(j)
-            r.data = data
-            report18.items.append(r)
-    return report18
-
-def parseReport19(reportPath):
-    report19 = aem_report19()
-    report19.exists = True
-    report19.path = reportPath
-    report19.version = getReportVersionNumber(open(reportPath).read())
-    with open(reportPath) as f:
-        text = f.read()
-    contents = text.split('alt = ')
-    contents.pop(0)
-    
-    for content in contents:
-        first_item = None
-        data = []
-        r = report19Item()
-        r.version = report19.version
-        content = content.replace('==============================================================', '===============================')
-        pieces = content.split("===============================")
-        parse_composition_temperature(pieces, r)
-        if first_item is None:
-            first_item = r
-            report19.target_solvent_comp = r.solvents_str_no_comma()
-            report19.target_salt_comp = r.salts_str_no_comma()
-        if r.solvents_str_no_comma() == report19.target_solvent_comp and r.salts_str_no_comma() == report19.target_salt_comp:
-            try:
-                table_section = pieces[1].split('------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------')[1]
-            except IndexError:
-                table_section = pieces[1]
-            foo = table_section.splitlines()
-            for fo in foo:
-                f = fo.replace("    ", " ").replace("   ", " ").replace("  ", " ")
-                d = f.strip().split()
-                if len(d) == 17:
-                    j = {r19var[i]: parse_float(d[i-3]) if i > 2 else d[i-3] for i in range(3, len(r19var))}
-                    j.update({
-                        r19var[0]: r.solvents_str_no_comma(),
-                        r19var[1]: r.salts_str_no_comma(),
-                        r19var[2]: r.temperature
-                    })
-                    data.append(j)
-            r.data = data
-            report19.items.append(r)
-    return report19
-
-def parseReport20(reportPath):
-    report20 = aem_report20()
-    report20.exists = True
-    report20.path = reportPath
-    report20.version = getReportVersionNumber(open(reportPath).read())
-    with open(reportPath) as f:
-        text = f.read()
-    contents = text.split('alt = ')
-    contents.pop(0)
-    
-    for content in contents:
-        first_item = None
-        data = []
-        r = report20Item()
-        r.version = report20.version
-        content = content.replace('==============================================================', '===============================')
-        pieces = content.split("===============================")
-        parse_composition_temperature(pieces, r)
-        if first_item is None:
-            first_item = r
-            report20.target_solvent_comp = r.solvents_str_no_comma()
-            report20.target_salt_comp = r.salts_str_no_comma()
-        if r.solvents_str_no_comma() == report20.target_solvent_comp and r.salts_str_no_comma() == report20.target_salt_comp:
-            try:
-                table_section = pieces[1].split('------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------')[1]
-            except IndexError:
-                table_section = pieces[1]
-            foo = table_section.splitlines()
-            for fo in foo:
-                f = fo.replace("    ", " ").replace("   ", " ").replace("  ", " ")
-                d = f.strip().split()
-                if len(d) == 17:
-                    j = {r20var[i]: parse_float(d[i-3]) if i > 2 else d[i-3] for i in range(3, len(r20var))}
-                    j.update({
-                        r20var[0]: r.solvents_str_no_comma(),
-                        r20var[1]: r.salts_str_no_comma(),
-                        r20var[2]: r.temperature
-                    })
-                    data.append(j)
-            r.data = data
-            report20.items.append(r)
-    return report20
+def parseReport10(reportPath, **options):
+    return parseReportFile(reportPath, 10, **options)
 
+def parseReport11(reportPath, **options):
+    return parseReportFile(reportPath, 11, **options)
 
-## aem_convert_to_csv thread definitions
-def write_report_01_csv(run, path):
-    run.report01.save_all_csv(path)
+def parseReport12(reportPath, **options):
+    return parseReportFile(reportPath, 12, **options)
 
-def write_report_02_csv(run, path):
-    run.report02.save_all_csv(path)
+def parseReport13(reportPath, **options):
+    return parseReportFile(reportPath, 13, **options)
 
-def write_report_03_csv(run, path):
-    run.report03.save_all_csv(path)
+def parseReport14(reportPath, **options):
+    return parseReportFile(reportPath, 14, **options)
 
-def write_report_04_csv(run, path):
-    run.report04.save_all_csv(path)
+def parseReport15(reportPath, **options):
+    return parseReportFile(reportPath, 15, **options)
 
-def write_report_05_csv(run, path):
-    run.report05.save_all_csv(path)
+def parseReport16(reportPath, **options):
+    return parseReportFile(reportPath, 16, **options)
 
-def write_report_06_csv(run, path):
-    run.report06.save_all_csv(path)
+def parseReport17(reportPath, **options):
+    return parseReportFile(reportPath, 17, **options)
 
-def write_report_10_csv(run, path):
-    run.report10.save_all_csv(path)
+def parseReport18(reportPath, **options):
+    return parseReportFile(reportPath, 18, **options)
 
-def write_report_11_csv(run, path):
-    run.report11.save_all_csv(path)
+def parseReport19(reportPath, **options):
+    return parseReportFile(reportPath, 19, **options)
 
-def write_report_12_csv(run, path):
-    run.report12.save_all_csv(path)
+def parseReport20(reportPath, **options):
+    return parseReportFile(reportPath, 20, **options)
 
-def write_report_13_csv(run, path):
-    run.report13.save_all_csv(path)
 
-def write_report_14_csv(run, path):
-    run.report14.save_all_csv(path)
+## Parsed Report Cache
+PARSED_CACHE_DIR = 'parsed'  # sidecar folder next to csv/ and json/
+PARSED_CACHE_FORMAT = 1  # bump when the pickled report classes change incompatibly
 
-def write_report_15_csv(run, path):
-    run.report15.save_all_csv(path)
+def parsedCachePath(reportPath, number):
+    return os.path.join(os.path.dirname(reportPath), PARSED_CACHE_DIR, f'Report{number:02d}.pkl')
 
-def write_report_16_csv(run, path):
-    run.report16.save_all_csv(path)
+def reportDigest(reportPath):
+    """SHA-256 of a report file."""
+    h = hashlib.sha256()
+    with open(reportPath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
 
-def write_report_17_csv(run, path):
-    run.report17.save_all_csv(path)
+def readParsedCache(reportPath, number, columnar=False, refresh=False):
+    """Return the cached aem_reportXX of a report file, or None if there is none or it is stale.
 
-def write_report_18_csv(run, path):
-    run.report18.save_all_csv(path)
+    The cache is valid if the report's size and mtime are unchanged, or failing that, if its
+    content hash is; only the small header is read before the report itself is unpickled.
+    With refresh, a hit on the hash alone rewrites the cache under the report's new mtime so
+    later reads skip hashing again.
+    """
+    rehashed = None
+    try:
+        with open(parsedCachePath(reportPath, number), 'rb') as f:
+            key = pickle.load(f)
+            st = os.stat(reportPath)
+            if (key.get('format') != PARSED_CACHE_FORMAT or key.get('columnar') != columnar
+                    or key.get('size') != st.st_size):
+                return None
+            if key.get('mtime_ns') != st.st_mtime_ns:
+                if key.get('sha256') != reportDigest(reportPath):
+                    return None
+                rehashed = key['sha256']
+            report = pickle.load(f)
+    except Exception:  # missing, truncated or written by an incompatible version
+        return None
+    report.path = reportPath
+    if refresh and rehashed is not None:
+        writeParsedCache(reportPath, number, report, columnar, digest=rehashed)
+    return report
+
+def writeParsedCache(reportPath, number, report, columnar=False, digest=None):
+    """Pickle a parsed report next to its file, keyed on the file's size, mtime and content hash."""
+    st = os.stat(reportPath)
+    key = {'format': PARSED_CACHE_FORMAT, 'columnar': columnar, 'size': st.st_size,
+           'mtime_ns': st.st_mtime_ns, 'sha256': digest or reportDigest(reportPath)}
+    path = parsedCachePath(reportPath, number)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, 'wb') as f:
+            pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(report, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)  # readers never see a partial cache file
+    except OSError as error:
+        print(f'### AEM-PARSER v1.1.0:: Could not cache {os.path.basename(reportPath)}: {error}')
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+def loadReportFile(reportPath, number, cache=False, **options):
+    """parseReportFile, served from and saved to the parsed report cache when cache is True."""
+    if not cache or splitArchivePath(reportPath)[0] is not None:  # archives are not written to
+        return parseReportFile(reportPath, number, **options)
+    columnar = options.get('columnar', False)
+    report = readParsedCache(reportPath, number, columnar, refresh=True)
+    if report is None:
+        report = parseReportFile(reportPath, number, **options)
+        writeParsedCache(reportPath, number, report, columnar)
+    return report
+
+## Memory-mapped Column Store
+NPY_SCHEMA_FILE = 'schema.json'
+NPY_SCHEMA_FORMAT = 1
+NPY_FLUSH_ROWS = 1 << 16  # values buffered per column file before each write
+
+def npyHeader(dtype, length):
+    """Header of a one-dimensional .npy file; NumPy pads it so that it can be rewritten in place."""
+    buf = io.BytesIO()
+    np.lib.format.write_array_header_1_0(buf, {'descr': np.lib.format.dtype_to_descr(dtype), 'fortran_order': False, 'shape': (length,)})
+    return buf.getvalue()
+
+class npyColumnFile:
+    """A one-dimensional .npy file written as values arrive; its header gets the final length on close.
+
+    Values are appended one at a time or as raw bytes of the array typecode, buffered, and converted
+    to the file's dtype when written, so it can stand in for the arrays of reportColumns.
+    """
+    def __init__(self, path, typecode, dtype):
+        self.path = path
+        self.pending = array(typecode)
+        self.source = np.dtype(typecode)
+        self.dtype = np.dtype(dtype)
+        self.count = 0
+        self.header_size = len(npyHeader(self.dtype, 0))
+        self.f = open(path, 'wb')
+        self.f.write(npyHeader(self.dtype, 0))
+
+    def __len__(self):
+        return self.count + len(self.pending)
+
+    def append(self, value):
+        self.pending.append(value)
+        if len(self.pending) >= NPY_FLUSH_ROWS:
+            self.flush()
+
+    def frombytes(self, data):
+        self.pending.frombytes(data)
+        if len(self.pending) >= NPY_FLUSH_ROWS:
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            values = np.frombuffer(self.pending, dtype=self.source).astype(self.dtype, copy=False)
+            self.f.write(values.tobytes())
+            self.count += len(values)
+            self.pending = array(self.pending.typecode)
+
+    def close(self):
+        self.flush()
+        header = npyHeader(self.dtype, self.count)
+        if len(header) != self.header_size:
+            raise ValueError(f"cannot finalize {self.path}: .npy header size changed")
+        self.f.seek(0)
+        self.f.write(header)
+        self.f.close()
+
+class reportColumnFiles(reportColumns):
+    """reportColumns that streams its columns to <name>.npy (and block-level codes to <name>.codes.npy) in folder."""
+    def __init__(self, names, folder, first=3, dtype=np.float64):
+        super().__init__(names, first)
+        os.makedirs(folder, exist_ok=True)
+        self.dtype = np.dtype(dtype)
+        self.values = {name: npyColumnFile(os.path.join(folder, f'{name}.npy'), 'd', dtype) for name in self.numeric}
+        self.codes = {name: npyColumnFile(os.path.join(folder, f'{name}.codes.npy'), 'i', np.int32) for name in self.codes}
+
+    def close(self):
+        """Finish every column file and return the column part of the schema entry."""
+        for f in itertools.chain(self.values.values(), self.codes.values()):
+            f.close()
+        return {'rows': self.length, 'dtype': self.dtype.name, 'columns': self.names, 'numeric': self.numeric,
+                'categories': self.categories}
+
+def writeReportMemmap(reportPath, number, folder, dtype=np.float64, memory_map=None):
+    """Parse a report file straight into .npy column files in folder, one block at a time.
+
+    Only the current block is held in memory, so reports larger than RAM can be converted.
+    Returns the report's schema entry.
+    """
+    spec = REPORT_SPECS[number]
+    report = spec.report_class()
+    files = None
+    blocks = []
+    for item in iterReportItems(reportPath, number, report, as_table=True, memory_map=memory_map):
+        if files is None:
+            files = reportColumnFiles(spec.default_columns(report.version), folder, spec.first, dtype)
+        start = len(files)
+        if item.table is not None:
+            files.append_table(*item.table)
+        else:
+            files.append(item.data)
+        blocks.append((start, len(files)))
+    if files is None:
+        files = reportColumnFiles(spec.default_columns(report.version), folder, spec.first, dtype)
+    return dict(number=number, version=report.version, source=os.path.basename(reportPath), blocks=blocks, **files.close())
+
+def writeMemmapSchema(d, dtype, reports):
+    with open(os.path.join(d, NPY_SCHEMA_FILE), 'w') as f:
+        json.dump({'format': NPY_SCHEMA_FORMAT, 'dtype': np.dtype(dtype).name, 'reports': reports}, f, indent=4)
+
+def save_memmap(runDirPath, d=None, dtype=np.float64, memory_map=None):
+    """Convert every report in runDirPath into a memory-mappable column store in d (default runDirPath/npy).
+
+    runDirPath may also be a run archive; the store then goes next to it, where Reports/npy would be.
+
+    Each report gets a folder d/ReportXX with one .npy file per column; d/schema.json holds the column
+    names, categories and block row ranges. dtype=np.float32 halves the size of the table columns.
+    """
+    d = d or os.path.join(os.path.splitext(runDirPath)[0] if isReportArchive(runDirPath) else runDirPath, 'npy')
+    os.makedirs(d, exist_ok=True)
+    reports = {}
+    for path in sorted(listReports(runDirPath)):
+        number = reportNumber(path)
+        if number is None or os.path.isdir(path):
+            continue
+        if reportSize(path) == 0:
+            print(f'### AEM-PARSER v1.1.0:: {os.path.basename(path)} is empty!')
+            continue
+        name = f'Report{number:02d}'
+        reports[name] = writeReportMemmap(path, number, os.path.join(d, name), dtype, memory_map)
+    writeMemmapSchema(d, dtype, reports)
+    return d
+
+class reportMemmap:
+    """A report of a column store written by save_memmap; its columns are memory-mapped on access."""
+    def __init__(self, folder, entry):
+        self.folder = folder
+        self.schema = entry
+        self.number = entry['number']
+        self.version = entry['version']
+        self.names = entry['columns']
+        self.numeric = entry['numeric']
+        self.categories = entry['categories']
+        self.blocks = [tuple(block) for block in entry['blocks']]  # (start, stop) rows of each 'alt = ' block
+        self.length = entry['rows']
+
+    def __len__(self):
+        return self.length
+
+    def column(self, name):
+        """Return a column: a read-only memmap for table columns, decoded objects for block-level columns."""
+        if name in self.categories:
+            categories = np.array(self.categories[name] + [None], dtype=object)
+            return categories[self.column_codes(name)]
+        return np.load(os.path.join(self.folder, f'{name}.npy'), mmap_mode='r')
+
+    def column_codes(self, name):
+        return np.load(os.path.join(self.folder, f'{name}.codes.npy'), mmap_mode='r')
+
+    def categorical_column(self, name):
+        return categoricalFromCodes(self.column_codes(name), self.categories[name])
+
+def load_memmap(run_dir):
+    """Open the column store of a run, returning {report number: reportMemmap}.
+
+    run_dir may be the store itself, a Reports folder holding npy/, or a run output folder.
+    """
+    for d in (run_dir, os.path.join(run_dir, 'npy'), os.path.join(run_dir, 'Reports', 'npy')):
+        path = os.path.join(d, NPY_SCHEMA_FILE)
+        if os.path.isfile(path):
+            with open(path) as f:
+                schema = json.load(f)
+            return {entry['number']: reportMemmap(os.path.join(d, name), entry) for name, entry in schema['reports'].items()}
+    raise FileNotFoundError(f"no {NPY_SCHEMA_FILE} in {run_dir}")
+
+## Run Archives
+ARCHIVE_INDEX = 'index.json'  # member index stored inside every archive
+ARCHIVE_FORMAT = 1
+ARCHIVE_EXTENSIONS = ('.zip', '.tar')
+_archive_indexes = {}
+
+def archive_reports(reportsDir, compression='zip', archive=None, remove=False):
+    """Pack a Reports folder (reports, csv/, json/, ...) into one compressed archive with a member index.
+
+    compression 'zip' writes a deflated zip; 'gz' or 'xz' write a tar whose members are each gzip or
+    xz compressed, so any report can still be read without unpacking the others. The archive is
+    written next to the folder (Reports.zip / Reports.tar) unless `archive` is given, and the folder
+    is deleted afterwards with remove. Returns the archive path.
+    """
+    if compression not in ('zip', 'gz', 'xz'):
+        raise ValueError(f"unknown compression {compression!r}, expected 'zip', 'gz' or 'xz'")
+    reportsDir = reportsDir.rstrip('/\\')
+    archive = archive or reportsDir + ('.zip' if compression == 'zip' else '.tar')
+    names = sorted(os.path.relpath(os.path.join(dirpath, f), reportsDir).replace(os.sep, '/')
+                   for dirpath, _, filenames in os.walk(reportsDir) for f in filenames)
+    members = {}
+    tmp = f'{archive}.{os.getpid()}.tmp'
+    try:
+        if compression == 'zip':
+            with zipfile.ZipFile(tmp, 'w', zipfile.ZIP_DEFLATED) as z:
+                for name in names:
+                    path = os.path.join(reportsDir, name)
+                    z.write(path, name)
+                    members[name] = archiveEntry(path, name, 'zip')
+                z.writestr(ARCHIVE_INDEX, json.dumps({'format': ARCHIVE_FORMAT, 'members': members}, indent=4))
+        else:
+            with tarfile.open(tmp, 'w') as tar:
+                for name in names:
+                    path = os.path.join(reportsDir, name)
+                    with tempfile.TemporaryFile() as packed:
+                        with open(path, 'rb') as f, (gzip.GzipFile(fileobj=packed, mode='wb', compresslevel=6, mtime=0) if compression == 'gz'
+                                                     else lzma.LZMAFile(packed, 'wb')) as c:
+                            shutil.copyfileobj(f, c, 1 << 20)
+                        info = tarfile.TarInfo(f'{name}.{compression}')
+                        info.size = packed.tell()
+                        info.mtime = os.path.getmtime(path)
+                        packed.seek(0)
+                        tar.addfile(info, packed)
+                    members[name] = archiveEntry(path, info.name, compression)
+                data = json.dumps({'format': ARCHIVE_FORMAT, 'members': members}, indent=4).encode('utf-8')
+                info = tarfile.TarInfo(ARCHIVE_INDEX)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+        os.replace(tmp, archive)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    if remove:
+        shutil.rmtree(reportsDir)
+    print(f'### AEM-PARSER v1.1.0:: Archived {len(names)} files from {reportsDir} into {archive}')
+    return archive
+
+def archiveEntry(path, member, codec):
+    st = os.stat(path)
+    return {'member': member, 'codec': codec, 'size': st.st_size, 'mtime': st.st_mtime, 'number': reportNumber(path)}
+
+def isReportArchive(path):
+    return path.endswith(ARCHIVE_EXTENSIONS) and os.path.isfile(path)
+
+def splitArchivePath(path):
+    """Split '<archive>/<member>' into (archive, member); (None, path) for an ordinary file."""
+    head, tail = os.path.split(path)
+    if head and isReportArchive(head):
+        return head, tail
+    return None, path
+
+def archiveIndex(archive):
+    """Member index of an archive, {name: entry}, memoized on the archive's path, size and mtime."""
+    st = os.stat(archive)
+    key = (os.path.realpath(archive), st.st_size, st.st_mtime_ns)
+    if key not in _archive_indexes:
+        if zipfile.is_zipfile(archive):
+            with zipfile.ZipFile(archive) as z:
+                index = json.loads(z.read(ARCHIVE_INDEX))
+        else:
+            with tarfile.open(archive, 'r:') as tar:
+                index = json.load(tar.extractfile(ARCHIVE_INDEX))
+        _archive_indexes[key] = index['members']
+    return _archive_indexes[key]
+
+class archiveMember(io.BufferedIOBase):
+    """Binary stream of an archive member; closing it also closes the archive it was opened from."""
+    def __init__(self, stream, archive):
+        self.stream = stream
+        self.archive = archive
+
+    def readable(self):
+        return True
 
-def write_report_19_csv(run, path):
-    run.report19.save_all_csv(path)
+    def read(self, size=-1):
+        return self.stream.read(size)
 
-def write_report_20_csv(run, path):
-    run.report20.save_all_csv(path)
+    def read1(self, size=-1):
+        return self.stream.read1(size)
 
-## aem_convert_to_csv Function
-def aem_convert_to_csv(dir):
-    print(f"### AEM-PARSER v1.1.0:: Starting .csv conversion...")
-    start_time = time.time()
-    if os.path.isdir(dir):
-        run = aem_run()
-        run.parse_run(dir)
-        d = os.path.join(dir, 'csv')
-        if not os.path.exists(d):
+    def readinto(self, b):
+        return self.stream.readinto(b)
+
+    def readline(self, size=-1):
+        return self.stream.readline(size)
+
+    def close(self):
+        if not self.closed:
             try:
-                os.mkdir(d)
-            except OSError as error:
-                print(f'### AEM-PARSER v1.1.0:: Error Occurred creating {d} directory: {error}')
-                os._exit(0)
-        threads = []
-        if run.report01.exists:
-            threads.append(threading.Thread(target=write_report_01_csv, args=(run, os.path.join(d, 'Report01.csv'))))
-        if run.report02.exists:
-            threads.append(threading.Thread(target=write_report_02_csv, args=(run, os.path.join(d, 'Report02.csv'))))
-        if run.report03.exists:
-            threads.append(threading.Thread(target=write_report_03_csv, args=(run, os.path.join(d, 'Report03.csv'))))
-        if run.report04.exists:
-            threads.append(threading.Thread(target=write_report_04_csv, args=(run, os.path.join(d, 'Report04.csv'))))
-        if run.report05.exists:
-            threads.append(threading.Thread(target=write_report_05_csv, args=(run, os.path.join(d, 'Report05.csv'))))
-        if run.report06.exists:
-            threads.append(threading.Thread(target=write_report_06_csv, args=(run, os.path.join(d, 'Report06.csv'))))
-        if run.report10.exists:
-            threads.append(threading.Thread(target=write_report_10_csv, args=(run, os.path.join(d, 'Report10.csv'))))
-        if run.report11.exists:
-            threads.append(threading.Thread(target=write_report_11_csv, args=(run, os.path.join(d, 'Report11.csv'))))
-        if run.report12.exists:
-            threads.append(threading.Thread(target=write_report_12_csv, args=(run, os.path.join(d, 'Report12.csv'))))
-        if run.report13.exists:
-            threads.append(threading.Thread(target=write_report_13_csv, args=(run, os.path.join(d, 'Report13.csv'))))
-        if run.report14.exists:
-            threads.append(threading.Thread(target=write_report_14_csv, args=(run, os.path.join(d, 'Report14.csv'))))
-        if run.report15.exists:
-            threads.append(threading.Thread(target=write_report_15_csv, args=(run, os.path.join(d, 'Report15.csv'))))
-        if run.report16.exists:
-            threads.append(threading.Thread(target=write_report_16_csv, args=(run, os.path.join(d, 'Report16.csv'))))
-        if run.report17.exists:
-            threads.append(threading.Thread(target=write_report_17_csv, args=(run, os.path.join(d, 'Report17.csv'))))
-        if run.report18.exists:
-            threads.append(threading.Thread(target=write_report_18_csv, args=(run, os.path.join(d, 'Report18.csv'))))
-        if run.report19.exists:
-            threads.append(threading.Thread(target=write_report_19_csv, args=(run, os.path.join(d, 'Report19.csv'))))
-        if run.report20.exists:
-            threads.append(threading.Thread(target=write_report_20_csv, args=(run, os.path.join(d, 'Report20.csv'))))
-
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
-        end_time = time.time()
-        elapsed_time = end_time - start_time
-        print(f"### AEM-PARSER v1.1.0:: Finished .csv conversion! Elapsed time: {elapsed_time:.2f} seconds")
-    else:
+                self.stream.close()
+            finally:
+                self.archive.close()
+                super().close()
+
+def openArchiveMember(archive, name):
+    """Open a member of an archive as a binary stream of its original content; close it when done."""
+    entry = archiveIndex(archive)[name]
+    if entry['codec'] == 'zip':
+        z = zipfile.ZipFile(archive)
+        return archiveMember(z.open(entry['member']), z)
+    tar = tarfile.open(archive, 'r:')
+    raw = tar.extractfile(entry['member'])
+    return archiveMember(gzip.GzipFile(fileobj=raw, mode='rb') if entry['codec'] == 'gz' else lzma.LZMAFile(raw), tar)
+
+def locateReports(reportsDir):
+    """Return reportsDir, or the archive it was packed into if the folder holds no report files.
+
+    Converting an archive writes csv/, json/, ... back into the folder, so its mere existence does not
+    mean the reports are still there.
+    """
+    if os.path.isdir(reportsDir) and any(reportNumber(path) is not None and os.path.isfile(path) for path in listReports(reportsDir)):
+        return reportsDir
+    for ext in ARCHIVE_EXTENSIONS:
+        if isReportArchive(reportsDir + ext):
+            return reportsDir + ext
+    return reportsDir
+
+def listReports(runDirPath):
+    """Paths of the files in a Reports folder, or of the top-level members of a run archive."""
+    if isReportArchive(runDirPath):
+        return [os.sep.join([runDirPath, name]) for name in archiveIndex(runDirPath) if '/' not in name]
+    return [os.sep.join([runDirPath, report]) for report in os.listdir(runDirPath)]
+
+def reportStat(reportPath):
+    """(size, mtime) of a report file or archive member."""
+    archive, name = splitArchivePath(reportPath)
+    if archive is None:
+        st = os.stat(reportPath)
+        return st.st_size, st.st_mtime
+    entry = archiveIndex(archive)[name]
+    return entry['size'], os.path.getmtime(archive)
+
+def reportSize(reportPath):
+    return reportStat(reportPath)[0]
+
+## Report merging (split runs)
+def splitReportText(text):
+    """Split report text into its header and its 'alt = ' blocks, each block starting at the beginning of its line."""
+    starts = []
+    pos = text.find('alt = ')
+    while pos != -1:
+        line_start = text.rfind('\n', 0, pos) + 1
+        if not starts or line_start != starts[-1]:
+            starts.append(line_start)
+        pos = text.find('alt = ', pos + len('alt = '))
+    if not starts:
+        return text, []
+    blocks = [text[a:b] for a, b in zip(starts, starts[1:] + [len(text)])]
+    return text[:starts[0]], blocks
+
+def reportBlockKey(block):
+    """Return the (composition, temperature) of a report block, or (block, None) if it cannot be read."""
+    try:
+        content = block.split('alt = ', 1)[1]
+        content = content.replace('==============================================================', '===============================')
+        pieces = content.split("===============================")
+        salts = ' '.join(pieces[0].split("at Temp. =")[0].split())
+        temperature = float(pieces[0].split("at Temp. =")[1].split("C")[0].strip())
+        solvents = ' '.join(pieces[1].split('-----------------------------------------------------------------------')[1].split())
+        return f'{salts}|{solvents}', temperature
+    except (IndexError, ValueError):
+        return block, None
+
+def merge_report_files(srcDirs, dstDir, sort_blocks=False, exclude=()):
+    """Merge the text reports of several sub-runs into one set of reports in dstDir.
+
+    Blocks are concatenated in srcDirs order under the header of the first report. With sort_blocks,
+    duplicate (composition, temperature) blocks are dropped and blocks are ordered by composition
+    (in order of first appearance) and temperature, as if all sub-runs had been one run; the rows of a
+    block keep AEM's salt molality (m2) order. Report files named in exclude are not merged.
+    """
+    os.makedirs(dstDir, exist_ok=True)
+    names = []
+    for srcDir in srcDirs:
+        for name in sorted(os.listdir(srcDir)):
+            if name not in names and name not in exclude and os.path.isfile(os.path.join(srcDir, name)):
+                names.append(name)
+    for name in names:
+        header = None
+        blocks = []
+        for srcDir in srcDirs:
+            path = os.path.join(srcDir, name)
+            if not os.path.isfile(path):
+                continue
+            with open(path) as f:
+                text = f.read()
+            h, b = splitReportText(text)
+            if not b:
+                blocks.append(text)  # reports without 'alt = ' blocks are concatenated as-is
+                continue
+            if header is None:
+                header = h
+            blocks.extend(b)
+        if sort_blocks:
+            compositions = {}
+            keyed = {}
+            for block in blocks:
+                composition, temperature = reportBlockKey(block)
+                compositions.setdefault(composition, len(compositions))
+                keyed.setdefault((composition, temperature), block)
+            order = sorted(keyed, key=lambda k: (compositions[k[0]], float('inf') if k[1] is None else k[1]))
+            blocks = [keyed[k] for k in order]
+        with open(os.path.join(dstDir, name), 'w') as f:
+            if header is not None:
+                f.write(header)
+            for block in blocks:
+                f.write(block)
+    print(f"### AEM-PARSER v1.1.0:: Merged {len(names)} report files from {len(srcDirs)} sub-runs into {dstDir}")
+
+## Report Conversion
+def save_csv_reports(run, d):
+    """Write Report01.csv ... Report20.csv for the parsed reports of run into folder d."""
+    threads = []
+    for number in REPORT_SPECS:
+        report = getattr(run, f'report{number:02d}')
+        if report.exists:
+            threads.append(threading.Thread(target=report.save_all_csv, args=(os.path.join(d, f'Report{number:02d}.csv'),)))
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+def save_reports(run, d, extension, method):
+    """Write Report01.<extension> ... Report20.<extension> with the aem_report method of that name into folder d."""
+    for number in REPORT_SPECS:
+        report = getattr(run, f'report{number:02d}')
+        if report.exists:
+            getattr(report, method)(os.path.join(d, f'Report{number:02d}.{extension}'))
+
+def save_json_reports(run, d):
+    """Write Report01.json ... Report20.json for the parsed reports of run into folder d."""
+    save_reports(run, d, 'json', 'save_all_json')
+
+def save_ndjson_reports(run, d):
+    """Write Report01.ndjson ... Report20.ndjson (one JSON row per line) for the parsed reports of run into folder d."""
+    save_reports(run, d, 'ndjson', 'save_all_ndjson')
+
+def save_parquet_reports(run, d):
+    """Write Report01.parquet ... Report20.parquet for the parsed reports of run into folder d (requires pyarrow)."""
+    importArrow()
+    save_reports(run, d, 'parquet', 'save_all_parquet')
+
+def save_npy_reports(run, d, dtype=np.float64):
+    """Write the parsed reports of run as a memory-mappable column store into folder d (see save_memmap)."""
+    reports = {}
+    for number in REPORT_SPECS:
+        report = getattr(run, f'report{number:02d}')
+        if report.exists:
+            reports[f'Report{number:02d}'] = report.save_all_npy(os.path.join(d, f'Report{number:02d}'), dtype)
+    writeMemmapSchema(d, dtype, reports)
+
+def save_arrow_reports(run, d):
+    """Write Report01.arrow ... Report20.arrow (Arrow IPC files) for the parsed reports of run into folder d (requires pyarrow)."""
+    importArrow()
+    save_reports(run, d, 'arrow', 'save_all_arrow')
+
+REPORT_WRITERS = {
+    'csv': save_csv_reports,
+    'json': save_json_reports,
+    'ndjson': save_ndjson_reports,
+    'parquet': save_parquet_reports,
+    'arrow': save_arrow_reports,
+    'npy': save_npy_reports
+}
+
+## aem_convert Function
+def aem_convert(dir, formats=('csv', 'json'), run=None, parse_workers=None, cache=False, output_dir=None):
+    """Parse the reports in dir once and write each requested format into dir/<format>.
+
+    Returns the parsed aem_run so callers can reuse it; pass an already parsed `run` to skip parsing.
+    With parse_workers > 1, the reports are parsed by that many processes, and with cache the parsed
+    reports are also saved to dir/parsed (see aem_run.parse_run). dir may also be a run archive
+    (see archive_reports); the outputs then go where the archived folder was, unless output_dir is given.
+    """
+    unknown = [fmt for fmt in formats if fmt not in REPORT_WRITERS]
+    if unknown:
+        raise ValueError(f"unknown output format(s) {unknown}, expected any of {list(REPORT_WRITERS)}")
+    names = ', '.join(f'.{fmt}' for fmt in formats)
+    print(f"### AEM-PARSER v1.1.0:: Starting {names} conversion...")
+    start_time = time.time()
+    if not os.path.isdir(dir) and not isReportArchive(dir):
         print(f'### AEM-PARSER v1.1.0:: {dir} does not exist')
         os._exit(0)
-
-## aem_convert_to_json Function
-def aem_convert_to_json(dir):
-    print(f"### AEM-PARSER v1.1.0:: Starting .json conversion...")
-    if (os.path.isdir(dir)):
+    if output_dir is None:
+        output_dir = os.path.splitext(dir)[0] if isReportArchive(dir) else dir
+    if run is None:
         run = aem_run()
-        run.parse_run(dir)
-        d = os.path.join(dir, 'json')
-        try: 
-            os.mkdir(d)
+        run.parse_run(dir, max_workers=parse_workers, cache=cache)
+    for fmt in formats:
+        d = os.path.join(output_dir, fmt)
+        try:
+            os.makedirs(d, exist_ok=True)
         except OSError as error:
-            print(f'### AEM-PARSER v1.1.0:: Error Occured creating {d} directory: {error}')
+            print(f'### AEM-PARSER v1.1.0:: Error Occurred creating {d} directory: {error}')
             os._exit(0)
-        if (run.report01.exists):
-            p = os.path.join(d, 'Report01.json')
-            f = open(p, "w")
-            f.write(run.report01.all_json())
-            f.close()
-        if (run.report02.exists):
-            p = os.path.join(d, 'Report02.json')
-            f = open(p, "w")
-            f.write(run.report02.all_json())
-            f.close()
-        if (run.report03.exists):
-            p = os.path.join(d, 'Report03.json')
-            f = open(p, "w")
-            f.write(run.report03.all_json())
-            f.close()
-        if (run.report04.exists):
-            p = os.path.join(d, 'Report04.json')
-            f = open(p, "w")
-            f.write(run.report04.all_json())
-            f.close()
-        if (run.report05.exists):
-            p = os.path.join(d, 'Report05.json')
-            f = open(p, "w")
-            f.write(run.report05.all_json())
-            f.close()
-        if (run.report06.exists):
-            p = os.path.join(d, 'Report06.json')
-            f = open(p, "w")
-            f.write(run.report06.all_json())
-            f.close()
-        if (run.report10.exists):
-            p = os.path.join(d, 'Report10.json')
-            f = open(p, "w")
-            f.write(run.report10.all_json())
-            f.close()
-        if (run.report11.exists):
-            p = os.path.join(d, 'Report11.json')
-            f = open(p, "w")
-            f.write(run.report11.all_json())
-            f.close()
-        if (run.report12.exists):
-            p = os.path.join(d, 'Report12.json')
-            f = open(p, "w")
-            f.write(run.report12.all_json())
-            f.close()
-        if (run.report13.exists):
-            p = os.path.join(d, 'Report13.json')
-            f = open(p, "w")
-            f.write(run.report13.all_json())
-            f.close()
-        if (run.report14.exists):
-            p = os.path.join(d, 'Report14.json')
-            f = open(p, "w")
-            f.write(run.report14.all_json())
-            f.close()
-        if (run.report15.exists):
-            p = os.path.join(d, 'Report15.json')
-            f = open(p, "w")
-            f.write(run.report15.all_json())
-            f.close()
-        if (run.report16.exists):
-            p = os.path.join(d, 'Report16.json')
-            f = open(p, "w")
-            f.write(run.report16.all_json())
-            f.close()
-        if (run.report17.exists):
-            p = os.path.join(d, 'Report17.json')
-            f = open(p, "w")
-            f.write(run.report17.all_json())
-            f.close()
-        if (run.report18.exists):
-            p = os.path.join(d, 'Report18.json')
-            f = open(p, "w")
-            f.write(run.report18.all_json())
-            f.close()
-        if (run.report19.exists):
-            p = os.path.join(d, 'Report19.json')
-            f = open(p, "w")
-            f.write(run.report19.all_json())
-            f.close()
-        if (run.report20.exists):
-            p = os.path.join(d, 'Report20.json')
-            f = open(p, "w")
-            f.write(run.report20.all_json())
-            f.close()
-        print(f"### AEM-PARSER v1.1.0:: Finished .json conversion!")
-    else:
-        print(f'### AEM-PARSER v1.1.0:: {sys.argv[1]} does not exist!')
-        os._exit(0)
+        REPORT_WRITERS[fmt](run, d)
+    elapsed_time = time.time() - start_time
+    print(f"### AEM-PARSER v1.1.0:: Finished {names} conversion! Elapsed time: {elapsed_time:.2f} seconds")
+    return run
+
+## aem_convert_to_csv Function
+def aem_convert_to_csv(dir, parse_workers=None, output_dir=None):
+    return aem_convert(dir, ('csv',), parse_workers=parse_workers, output_dir=output_dir)
+
+## aem_convert_to_json Function
+def aem_convert_to_json(dir, parse_workers=None, output_dir=None):
+    return aem_convert(dir, ('json',), parse_workers=parse_workers, output_dir=output_dir)
+
+## aem_convert_to_ndjson Function
+def aem_convert_to_ndjson(dir, parse_workers=None, output_dir=None):
+    return aem_convert(dir, ('ndjson',), parse_workers=parse_workers, output_dir=output_dir)
@@ -0,0 +1,413 @@
+# ============================================================================
+"""     Advanced Electrolyte Model (AEM) Stand-in Executable v1.0.0        """
+"""            © 2025 Ridgetop Group, Inc., All Rights Reserved            """
+# ============================================================================
+"""
+Pure-Python stand-in for the AEM executable and DLM licence check, for machines that cannot run the
+Windows binaries (Linux CI, build nodes). It reads the non-ACCC cue deck produced by
+AEM_API.generate_cues() on stdin and writes Report1..Report20 in the text layout parsed by AEM_PARSER,
+with synthetic values. Output size and runtime are set with --rows/--matrix-step/--delay or the
+matching AEM_STANDIN_* environment variables.
+
+    python AEM_STANDIN.py install <AEMHomePath>   # writes an AEM-STANDIN launcher into the AEM home
+    python AEM_STANDIN.py check                   # DLM check, prints AEM_STANDIN_DLM_STATUS (default 1)
+    python AEM_STANDIN.py < cues.txt              # writes the reports into the working directory
+"""
+
+## Import Libraries
+import argparse
+import csv
+import math
+import os
+import random
+import sys
+import time
+from AEM_PARSER import (SOLVENT_ABBREVIATIONS, r01var, r01var_2242, r02var, r03var, r04var, r05var, r05var_2242, r06var,
+                        r10var, r11var, r12var, r12var_2242, r13var, r14var, r15var, r16var, r17var, r18var, r19var, r20var)
+
+## Stand-in Paths and Defaults
+STANDIN_HOME_PATH = os.path.dirname(os.path.realpath(__file__))
+AEM_SOLVENTS = os.path.join(STANDIN_HOME_PATH, "data", "AEM_solvents.csv")
+AEM_SALTS = os.path.join(STANDIN_HOME_PATH, "data", "AEM_salts.csv")
+LAUNCHER_NAME = "AEM-STANDIN"
+DUAL_SALT_PROPORTIONS = (0.25, 0.5, 0.75)  # first-salt proportions swept when saltcomp=2
+
+## Report Layouts: file name -> (report no., table separator width, data columns); mirrors parseReportXX
+REPORT_FILES = [
+    "Report1 -- Summary of Key Properties",
+    "Report2 -- Ion association populations and other thermodynamic terms",
+    "Report3 -- Ion solvation energies, permittivity and cation desolvation",
+    "Report4 -- Diffusivities and selected conductivity terms",
+    "Report5 -- Summary of Transport Properties and Walden analysis",
+    "Report6 -- Activation Energies",
+    "Report7 -- Large-Scale Simulation Optimization",
+    "Report8 -- Non-convergent cases",
+    "Report9 --  Double-Layer Regions transport analysis",
+    "Report10 -- Electrode surface-charge effects",
+    "Report11 -- Summary of Ion Solvation Quantities",
+    "Report12 -- Preferential Ion Solvation",
+    "Report13 -- Conductivity Factors",
+    "Report14 -- Li-STEP Terms",
+    "Report15 -- Cation transit under Faradaic conditions",
+    "Report16 -- Surface Tension and pore filling time over salt conc",
+    "Report17 -- Percent pore length filled over time",
+    "Report18 -- Ligand-wise cation desolvation energy and time",
+    "Report19 -- Ligand-wise cation desolvation energy and time (accounting for CS)",
+    "Report20 -- Terms relating to structure and Communal Ion Solvation (CS)"
+]
+
+def report_layouts(version):
+    """Return {report no.: (separator width, data column names)} for the reports that have tables."""
+    v2242 = version == '2.24.2'
+    return {
+        1: (168, (r01var_2242 if v2242 else r01var)[3:]),
+        2: (209, r02var[3:]),
+        3: (136, r03var[3:]),
+        4: (160, r04var[3:]),
+        5: (182, (r05var_2242 if v2242 else r05var)[3:]),
+        6: (110, r06var[3:]),
+        10: (108, r10var[14:]),
+        11: (139, r11var[3:]),
+        12: (131, r12var_2242[3:]) if v2242 else (157, r12var[3:]),
+        13: (142, r13var[3:]),
+        14: (154, r14var[3:]),
+        15: (191, r15var[3:]),
+        16: (182, r16var[3:]),
+        17: (161, r17var[3:]),
+        18: (180, r18var[3:]),
+        19: (180, r19var[3:]),
+        20: (180, r20var[3:])
+    }
+
+## Helper Functions
+def env_number(name, default, cast=float):
+    value = os.environ.get(name)
+    return default if value in (None, '') else cast(value)
+
+def load_names(path, solvents):
+    """Map AEM cue IDs to the component names AEM prints in report headers."""
+    names = {}
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            name = row['name'].strip()
+            if solvents:
+                short = name.split(' (')[0].strip()
+                if short in SOLVENT_ABBREVIATIONS:
+                    name = short
+                elif name not in SOLVENT_ABBREVIATIONS:
+                    name = row['string'].strip()
+            names[int(row['cue'])] = name
+    return names
+
+def positive_partitions(total, parts):
+    if parts == 1:
+        yield (total,)
+        return
+    for first in range(1, total - parts + 2):
+        for rest in positive_partitions(total - first, parts - 1):
+            yield (first,) + rest
+
+## Cue Deck
+class cueDeck:
+    """Cursor over the newline-separated cues written by AEM_API.generate_cues() (non-ACCC layout)."""
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def take(self):
+        if self.pos >= len(self.tokens):
+            raise ValueError("cue deck ended early")
+        self.pos += 1
+        return self.tokens[self.pos - 1]
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else ''
+
+    def take_int(self):
+        return int(float(self.take()))
+
+    def take_float(self):
+        return float(self.take())
+
+def read_cue_deck(tokens, solvent_names, salt_names, matrix_solvents=None):
+    """Decode a cue deck into a settings dict; raises ValueError if the cues do not fit the AEM prompts."""
+    deck = {"cmf": None, "saltcomp": 1, "totalsaltconc": None, "scaep": None, "dl": None}
+    cues = cueDeck(tokens)
+    deck["solventcomp"] = cues.take_int()
+    if deck["solventcomp"] == 1:
+        deck["basis"] = cues.take_int()
+        n = cues.take_int()
+        ids = [cues.take_int() for _ in range(n)]
+        proportions = [cues.take_float() for _ in range(n)] if n > 1 else [1.0]
+    elif deck["solventcomp"] == 2:
+        # Matrix decks carry no solvent count, so the caller tries each possible count
+        n = matrix_solvents
+        cmfoption = cues.take_int() if n > 2 else None
+        ids = []
+        for index in range(n):
+            ids.append(cues.take_int())
+            if cmfoption == 1 and deck["cmf"] is None:
+                cues.take_int()  # CMF indicator
+                if '.' in cues.peek():
+                    fraction = cues.take_float()
+                    deck["cmf"] = (index, fraction / 100 if fraction > 1 else fraction)
+        proportions = None
+    else:
+        raise ValueError(f"unknown solvent composition mode {deck['solventcomp']}")
+    unknown = [i for i in ids if i not in solvent_names]
+    if unknown:
+        raise ValueError(f"unknown solvent cue(s) {unknown}")
+    deck["solvents"] = [solvent_names[i] for i in ids]
+    deck["solvent_proportions"] = proportions
+    number_of_salts = cues.take_int()
+    if number_of_salts not in (1, 2):
+        raise ValueError(f"number of salts must be 1 or 2, got {number_of_salts}")
+    ids = [cues.take_int() for _ in range(number_of_salts)]
+    unknown = [i for i in ids if i not in salt_names]
+    if unknown:
+        raise ValueError(f"unknown salt cue(s) {unknown}")
+    deck["salts"] = [salt_names[i] for i in ids]
+    deck["salt_proportions"] = [1.0]
+    if number_of_salts > 1:
+        deck["saltcomp"] = cues.take_int()
+        if deck["saltcomp"] == 1:
+            deck["salt_proportions"] = [cues.take_float() for _ in range(number_of_salts)]
+        elif deck["saltcomp"] != 2:
+            raise ValueError(f"unknown salt composition mode {deck['saltcomp']}")
+    deck["saltconcmode"] = cues.take_int()
+    if deck["saltconcmode"] == 1:
+        deck["totalsaltconc"] = cues.take_float()
+    elif deck["saltconcmode"] != 2:
+        raise ValueError(f"unknown salt concentration mode {deck['saltconcmode']}")
+    for key in ("tmin", "tmax", "stepsize", "tis", "contactangle", "porelength", "saltconc"):
+        deck[key] = cues.take_float()
+    if deck["solventcomp"] == 1:
+        if cues.take_int() == 1:
+            deck["scaep"] = {key: cues.take_float() for key in ("pulse", "cellvoltage", "bulksaltconc", "thickness", "permittivity", "porosity")}
+        if cues.take_int() == 1:
+            deck["dl"] = {key: cues.take_float() for key in ("saltconc", "currentdensity", "temperature")}
+    if cues.take() != '0' or cues.pos != len(tokens):
+        raise ValueError("unexpected cues after the end of the deck")
+    if deck["stepsize"] <= 0 or deck["tmax"] < deck["tmin"]:
+        raise ValueError("invalid temperature range")
+    return deck
+
+def parse_cue_deck(text, solvent_names, salt_names):
+    tokens = text.split()
+    if not tokens:
+        raise ValueError("empty cue deck")
+    if tokens[0] != '2':
+        return read_cue_deck(tokens, solvent_names, salt_names)
+    errors = []
+    for n in range(2, 6):
+        try:
+            return read_cue_deck(tokens, solvent_names, salt_names, matrix_solvents=n)
+        except ValueError as e:
+            errors.append(f"{n} solvents: {e}")
+    raise ValueError("cannot decode matrix cue deck (" + "; ".join(errors) + ")")
+
+## Synthetic Report Writer
+class standinRun:
+    """Writes synthetic AEM reports for a decoded cue deck."""
+    def __init__(self, deck, rows=25, matrix_step=0.1, delay=0.0, version='2.24.3', seed=0, sentinel_rate=0.002):
+        self.deck = deck
+        self.rows = max(1, rows)
+        self.matrix_step = matrix_step
+        self.delay = delay
+        self.version = version
+        self.rng = random.Random(seed)
+        self.sentinel_rate = sentinel_rate
+        self.layouts = report_layouts(version)
+        # One smooth response model per (report, column): scale, linear and quadratic terms, temperature coefficient
+        self.models = {
+            number: [(10 ** self.rng.uniform(-3, 3), self.rng.uniform(-0.5, 1.5), self.rng.uniform(-0.1, 0.1), self.rng.uniform(-1, 1))
+                     for _ in columns]
+            for number, (_, columns) in self.layouts.items()
+        }
+
+    def temperatures(self):
+        d = self.deck
+        count = int(math.floor((d["tmax"] - d["tmin"]) / d["stepsize"] + 1e-9)) + 1
+        return [round(d["tmin"] + k * d["stepsize"], 6) for k in range(count)]
+
+    def solvent_compositions(self):
+        d = self.deck
+        if d["solvent_proportions"] is not None:
+            total = sum(d["solvent_proportions"]) or 1.0
+            return [[p / total for p in d["solvent_proportions"]]]
+        n = len(d["solvents"])
+        units = max(int(round(1 / self.matrix_step)), n)
+        if d["cmf"] is None:
+            return [[u / units for u in parts] for parts in positive_partitions(units, n)]
+        # The constant-mass-fraction solvent is held fixed; the others share the remainder on the step grid
+        index, fraction = d["cmf"]
+        units = max(int(round(1 / self.matrix_step)), n - 1)
+        compositions = []
+        for parts in positive_partitions(units, n - 1):
+            composition = [(1 - fraction) * u / units for u in parts]
+            composition.insert(index, fraction)
+            compositions.append(composition)
+        return compositions
+
+    def salt_compositions(self):
+        d = self.deck
+        if len(d["salts"]) == 1:
+            return [[1.0]]
+        if d["saltcomp"] == 1:
+            total = sum(d["salt_proportions"]) or 1.0
+            return [[p / total for p in d["salt_proportions"]]]
+        return [[p, 1 - p] for p in DUAL_SALT_PROPORTIONS]
+
+    def concentrations(self):
+        top = self.deck["totalsaltconc"] if self.deck["saltconcmode"] == 1 else 0.1
+        low = top / self.rows if self.deck["saltconcmode"] == 1 else 0.001
+        if self.rows == 1:
+            return [top]
+        return [low + (top - low) * i / (self.rows - 1) for i in range(self.rows)]
+
+    def header(self, name):
+        return (f"  AEM ver. {self.version}M-D-ACCC\n"
+                f"  Advanced Electrolyte Model -- {name.split(' -- ', 1)[1].strip()}\n"
+                f"  Synthetic output written by AEM-STANDIN (not model results)\n\n")
+
+    def block_header(self, salt_text, temperature, solvent_table):
+        return (f" Salt = {salt_text}        at Temp. = {temperature:7.2f} C\n"
+                f" {'=' * 62}\n"
+                f"   Solvent                                    mole fr.    mass fr.    vol. fr.\n"
+                f" {'-' * 71}\n"
+                f"{solvent_table}"
+                f" {'-' * 71}\n")
+
+    def report10_specifics(self, block_rng):
+        scaep = self.deck["scaep"]
+        pulse = "Discharge" if int(scaep["pulse"]) == 1 else "Charge"
+        return ("  \n  \n"
+                f"  Surface Charge Density at target electrode surface: {block_rng.uniform(1e-6, 1e-4):.5E}  C/cm^2\n"
+                f"  Cell Voltage at start of pulse: {scaep['cellvoltage']:.4f}  V\n"
+                f"  Electrolyte permittivity is evaluated for the bulk salt concentration\n"
+                f"  of the electrolyte  at  {scaep['bulksaltconc']:.4f}  molal\n"
+                f"  Pulse conditions:\n"
+                f"  Pulse type: {pulse}; target electrode held at the cell voltage above\n"
+                f"  Electrolyte Rel. Perm. at Salt Conc.: {block_rng.uniform(10, 60):.4f}  (reference at infinite r distance)\n"
+                f"  Dipole Moment, data:  {block_rng.uniform(1, 5):.4f}  D\n"
+                f"  Solvent diameter:  {block_rng.uniform(4, 7):.4f}  Angstroms\n"
+                f"  Equivalent charge on solvent dipole: {block_rng.uniform(0.1, 0.6):.5E}\n"
+                f"  SEI properties:\n"
+                f"      SEI thickness at target electrode: {scaep['thickness']:.4f}  Angstroms\n"
+                f"      SEI porosity at target electrode: {scaep['porosity']:.4f}  Angstroms\n"
+                f"      SEI relative permittivity at target electrode: {scaep['permittivity']:.4f}\n")
+
+    def table(self, number, xs, temperature, block_rng):
+        width, columns = self.layouts[number]
+        lines = ["   " + "  ".join(columns), " " + "-" * width]
+        scale_t = (temperature - 25.0) / 100.0
+        for x in xs:
+            values = [f"{x:11.5f}"]
+            for scale, slope, curve, temp in self.models[number][1:]:
+                if block_rng.random() < self.sentinel_rate:
+                    values.append("   ********")
+                    continue
+                v = scale * (1 + slope * x + curve * x * x) * math.exp(temp * scale_t) * (1 + 0.01 * (block_rng.random() - 0.5))
+                values.append(f"{v:11.4E}")
+            if number == 3:
+                values[9:9] = ["/"]  # alpha1 / alpha3
+                if block_rng.random() < self.sentinel_rate:
+                    values.append("*DNC*")
+            lines.append("  " + " ".join(values))
+        return "\n".join(lines) + "\n\n"
+
+    def write(self, out_dir='.'):
+        d = self.deck
+        temperatures = self.temperatures()
+        solvent_compositions = self.solvent_compositions()
+        salt_compositions = self.salt_compositions()
+        concentrations = self.concentrations()
+        total = len(solvent_compositions) * len(salt_compositions) * len(temperatures)
+        files = {}
+        try:
+            for number, name in enumerate(REPORT_FILES, start=1):
+                files[number] = open(os.path.join(out_dir, name), 'w')
+                if number == 10 and d["scaep"] is None:
+                    continue  # SCAEP not requested: AEM leaves Report10 empty
+                files[number].write(self.header(name))
+            done = 0
+            for solvents in solvent_compositions:
+                solvent_table = "".join(f"   {name:<40s} {p:10.5f}  {p:10.5f}  {p:10.5f}\n" for name, p in zip(d["solvents"], solvents))
+                for salts in salt_compositions:
+                    salt_text = " + ".join(f"{p:.3f} {name}" for name, p in zip(d["salts"], salts))
+                    for temperature in temperatures:
+                        done += 1
+                        block_rng = random.Random(self.rng.random())
+                        head = self.block_header(salt_text, temperature, solvent_table)
+                        for number, (_, columns) in self.layouts.items():
+                            if number == 10:
+                                if d["scaep"] is None:
+                                    continue
+                                files[10].write(head + self.report10_specifics(block_rng) + self.table(10, [i * 2.0 for i in range(1, self.rows + 1)], temperature, block_rng))
+                            elif number == 17:
+                                files[17].write(head + self.table(17, [i * 0.5 for i in range(1, self.rows + 1)], temperature, block_rng))
+                            else:
+                                files[number].write(head + self.table(number, concentrations, temperature, block_rng))
+                        for f in files.values():
+                            f.flush()
+                        print(f"### AEM-STANDIN v1.0.0:: Block {done}/{total}: {salt_text} at {temperature:.2f} C")
+                        if self.delay:
+                            time.sleep(self.delay)
+        finally:
+            for f in files.values():
+                f.close()
+        return total
+
+## Launcher Installation
+def install(AEMHomePath, name=LAUNCHER_NAME):
+    """Write a launcher for this stand-in into the AEM home; use it as AEMProgramName and as DLM_EXECUTABLE."""
+    os.makedirs(AEMHomePath, exist_ok=True)
+    if os.name == 'nt':
+        path = os.path.join(AEMHomePath, name + ".cmd")
+        with open(path, 'w') as f:
+            f.write(f'@"{sys.executable}" "{os.path.realpath(__file__)}" %*\n')
+    else:
+        path = os.path.join(AEMHomePath, name)
+        with open(path, 'w') as f:
+            f.write(f"#!{sys.executable}\n"
+                    f"import sys\n"
+                    f"sys.path.insert(0, {STANDIN_HOME_PATH!r})\n"
+                    f"from AEM_STANDIN import main\n"
+                    f"sys.exit(main())\n")
+        os.chmod(path, 0o755)
+    print(f"### AEM-STANDIN v1.0.0:: Launcher written to {path}")
+    return path
+
+## Command Line
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stand-in for the AEM executable and DLM licence check.")
+    parser.add_argument("command", nargs="?", default="run", choices=["run", "check", "install"])
+    parser.add_argument("path", nargs="?", help="AEM home directory (install)")
+    parser.add_argument("--rows", type=int, default=env_number("AEM_STANDIN_ROWS", 25, int), help="rows per block (salt concentrations)")
+    parser.add_argument("--matrix-step", type=float, default=env_number("AEM_STANDIN_MATRIX_STEP", 0.1), help="mass-fraction step of matrix runs")
+    parser.add_argument("--delay", type=float, default=env_number("AEM_STANDIN_DELAY", 0.0), help="seconds to sleep after each block")
+    parser.add_argument("--version", default=os.environ.get("AEM_STANDIN_VERSION", "2.24.3"), choices=["2.24.2", "2.24.3"])
+    parser.add_argument("--seed", type=int, default=env_number("AEM_STANDIN_SEED", 0, int))
+    parser.add_argument("--sentinel-rate", type=float, default=env_number("AEM_STANDIN_SENTINEL_RATE", 0.002), help="fraction of values written as ********")
+    parser.add_argument("--exit-code", type=int, default=env_number("AEM_STANDIN_EXIT_CODE", 0, int), help="exit code after writing the reports")
+    args = parser.parse_args(argv)
+    if args.command == "check":
+        print(os.environ.get("AEM_STANDIN_DLM_STATUS", "1"))
+        return 0
+    if args.command == "install":
+        install(args.path or os.getcwd())
+        return 0
+    try:
+        deck = parse_cue_deck(sys.stdin.read(), load_names(AEM_SOLVENTS, True), load_names(AEM_SALTS, False))
+    except ValueError as e:
+        print(f"### AEM-STANDIN v1.0.0:: Invalid cue deck: {e}", file=sys.stderr)
+        return 2
+    start_time = time.time()
+    run = standinRun(deck, rows=args.rows, matrix_step=args.matrix_step, delay=args.delay, version=args.version,
+                     seed=args.seed, sentinel_rate=args.sentinel_rate)
+    blocks = run.write()
+    print(f"### AEM-STANDIN v1.0.0:: Wrote {blocks} blocks x {len(REPORT_FILES)} reports in {time.time() - start_time:.2f} s")
+    return args.exit_code
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+import contextlib
+import io
+import math
+import os
+import re
+
+import pytest
+
+import AEM_PARSER as P
+from AEM_STANDIN import standinRun
+
+REPORT10 = "Report10 -- Electrode surface-charge effects"
+
+def standinDeck(tmin=0, tmax=40, stepsize=20):
+    return {"cmf": None, "saltcomp": 1, "totalsaltconc": 2.0, "saltconcmode": 1,
+            "scaep": {"pulse": 1, "cellvoltage": 4.0, "bulksaltconc": 1.0, "thickness": 50.0, "permittivity": 5.0, "porosity": 0.3},
+            "dl": None, "solvents": ["ethylene carbonate", "dimethyl carbonate"], "solvent_proportions": [0.5, 0.5],
+            "salts": ["LiPF6"], "salt_proportions": [1.0], "tmin": tmin, "tmax": tmax, "stepsize": stepsize}
+
+@pytest.fixture
+def starred_reports(tmp_path):
+    """Stand-in reports whose first Report10 block has a '********' surface charge density header."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        standinRun(standinDeck(), rows=5, sentinel_rate=0).write(str(tmp_path))
+    path = tmp_path / REPORT10
+    text = re.sub(r"surface: \S+", "surface: ********", path.read_text(), count=1)
+    path.write_text(text)
+    return str(tmp_path)
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_starred_header_to_dataframe(starred_reports, columnar):
+    report = P.aem_run(starred_reports, columnar=columnar).report10
+    df = report.to_dataframe()
+    densities = df["surface_charge_density"]
+    assert len(df) == 15
+    assert densities[:5].isna().all() and densities[5:].notna().all()
+    assert not any(isinstance(c, float) and math.isnan(c) for c in densities.cat.categories)
+    assert math.isnan(next(report.iter_rows())["surface_charge_density"])
+    header, first = list(report.iter_csv())[:2]
+    assert first.split(",")[header.rstrip("\n").split(",").index("surface_charge_density")] == "nan"
+
+def test_starred_header_memmap(starred_reports):
+    with contextlib.redirect_stdout(io.StringIO()):
+        P.save_memmap(starred_reports)
+    store = P.load_memmap(starred_reports)[10]
+    densities = store.categorical_column("surface_charge_density")
+    assert len(densities) == 15
+    assert densities.isna().sum() == 5
+    assert math.isnan(store.column("surface_charge_density")[0])
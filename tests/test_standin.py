@@ -0,0 +1,95 @@
+"""End-to-end runs against the AEM_STANDIN executable, and the parser against checked-in report samples."""
+import contextlib
+import hashlib
+import io
+import json
+import os
+
+import pytest
+
+import AEM_API as A
+import AEM_PARSER as P
+from AEM_STANDIN import install
+
+SAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "aem_reports")
+REPORT01 = "Report1 -- Summary of Key Properties"
+
+@pytest.fixture
+def aem_home(tmp_path, monkeypatch):
+    """An AEM home holding the stand-in launcher, which also answers the DLM check."""
+    home = str(tmp_path / "home")
+    launcher = install(home)
+    monkeypatch.setenv("AEM_DLM_EXECUTABLE", launcher)  # sub-runs in worker processes re-import AEM_API
+    monkeypatch.setenv("AEM_STANDIN_ROWS", "5")
+    monkeypatch.setattr(A, "DLM_EXECUTABLE", launcher)
+    monkeypatch.setattr(A, "DLM_CACHE_FILE", str(tmp_path / ".dlm_status.json"))
+    A._dlm_status.clear()
+    return home
+
+def make_run(home, out, run_name, **kw):
+    electrolyte = A.ElectrolyteComposition.translate_electrolyte(solvents={"EP": 25, "DMC": 50, "EC": 25}, salts={"LiPF6": 1.0})
+    params = dict(number_of_total_solvents=3, number_of_accc_solvents=0, number_of_total_salts=1, number_of_accc_salts=0,
+                  solventcomp=1, solventcomppropbasis=1, saltcomp=1, saltconcmode=1, totalsaltconc=5, tmin=-30, tmax=60,
+                  stepsize=10, tis=1, contactangle=35, porelength=20, saltconc=1.5, scaep=0, dl=0, output_dir=str(out),
+                  run_name=run_name, AEMHomePath=home, AEMProgramName=os.path.basename(A.DLM_EXECUTABLE))
+    params.update(kw)
+    aem = A.AEM_API(electrolyte=electrolyte, **params)
+    aem.generate_cues()
+    return aem
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+def test_end_to_end_run(aem_home, tmp_path):
+    aem = make_run(aem_home, tmp_path / "out", "e2e")
+    aem.runAEM()
+    assert aem.run_yet and aem.attempts[-1]["status"] == "completed"
+    assert [item.temperature for item in aem.parsed_run.report01.items] == [float(t) for t in range(-30, 61, 10)]
+    reports = os.path.join(aem.run_output_dir, "Reports")
+    assert os.path.getsize(os.path.join(reports, "csv", "Report01.csv")) > 0
+    assert os.path.isfile(os.path.join(reports, "json", "Report01.json"))
+    assert any(name.endswith("-Log.json") for name in os.listdir(aem.run_output_dir))
+
+def test_result_cache_hit(aem_home, tmp_path):
+    cache = A.AEM_ResultCache(str(tmp_path / "cache"))
+    first = make_run(aem_home, tmp_path / "out", "first", result_cache=cache)
+    first.runAEM()
+    second = make_run(aem_home, tmp_path / "out", "second", result_cache=cache)
+    second.runAEM()
+    assert not first.cache_hit and second.cache_hit
+    assert second.attempts == []  # the executable was not launched
+    original = os.path.join(first.run_output_dir, "Reports", REPORT01)
+    restored = os.path.join(second.run_output_dir, "Reports", REPORT01)
+    assert read(restored) == read(original)
+    assert os.stat(restored).st_nlink == 1  # a copy, not a link into the cache
+    assert read(os.path.join(os.path.dirname(restored), "csv", "Report01.csv")) == \
+        read(os.path.join(os.path.dirname(original), "csv", "Report01.csv"))
+
+def test_shard_merge(aem_home, tmp_path):
+    whole = make_run(aem_home, tmp_path / "out", "whole")
+    whole.runAEM()
+    sharded = make_run(aem_home, tmp_path / "out", "sharded")
+    sharded.runAEM_sharded(temperature_shards=2, max_workers=2)
+    assert [s["status"] for s in sharded.subruns] == ["completed", "completed"]
+    assert [item.temperature for item in sharded.parsed_run.report01.items] == [float(t) for t in range(-30, 61, 10)]
+    assert len(sharded.parsed_run.report05.items) == len(whole.parsed_run.report05.items)
+    assert not sharded.parsed_run.report06.exists  # fitted over the whole range, so not merged from shards
+    assert not os.path.isdir(os.path.join(sharded.run_output_dir, "SubRuns"))
+
+def digest(text):
+    return hashlib.sha256(text.encode()).hexdigest()
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("sample", ["v2.24.3", "v2.24.2"])
+def test_parser_matches_baseline(sample, columnar):
+    """expected.json holds the output of the parser as it was before the streaming/columnar rewrite."""
+    with open(os.path.join(SAMPLES, "expected.json")) as f:
+        expected = json.load(f)[sample]
+    with contextlib.redirect_stdout(io.StringIO()):
+        run = P.aem_run(os.path.join(SAMPLES, sample), columnar=columnar)
+    for name, want in expected.items():
+        report = getattr(run, name.lower())
+        got = {"exists": report.exists, "version": report.version, "items": len(report.items),
+               "json_sha256": digest(report.all_json()), "csv_sha256": digest(report.all_csv())}
+        assert got == want, name